@@ -1,3 +1,5 @@
+import os
+
 MAINNET_ENDPOINT = "wss://entrypoint-finney.opentensor.ai:443"
 
 NETUID_MAINNET = 5
@@ -9,6 +11,9 @@ HEALTH_ENDPOINT = "/health"
 QUERY_ENDPOINT = "/query"
 CHECK_TASK_ENDPOINT = "/check-task"
 
+# Test mode for the miner endpoints; read once at startup, not per request
+SKIP_EPISTULA_VERIFY = os.getenv("SKIP_EPISTULA_VERIFY", "false").lower() == "true"
+
 BLOCK_TIME = 12
 
 # ARC Problem parameters
@@ -1,5 +1,6 @@
 import json
 import time
+import orjson
 from typing import Dict, Any, Tuple, Optional
 from substrateinterface import Keypair
 from loguru import logger
@@ -71,12 +72,8 @@ class Epistula:
             max_age_ns = Epistula.ALLOWED_DELTA_NS
         
         try:
-            if isinstance(body, bytes):
-                body_str = body.decode('utf-8')
-            else:
-                body_str = body
-            
-            body_json = json.loads(body_str)
+            # orjson takes bytes or str directly; JSONDecodeError subclasses json's
+            body_json = orjson.loads(body)
             
             required_fields = ['data', 'nonce', 'signed_by', 'signed_for']
             for field in required_fields:
@@ -102,7 +99,7 @@ class Epistula:
             # remove '0x' prefix from signature
             sig_bytes = bytes.fromhex(signature[2:])
             
-            # recreate the exact signed message
+            # recreate the exact signed message (stdlib format, as signed by create_request)
             body_to_verify = json.dumps(body_json, sort_keys=True)
             
             verified = keypair.verify(body_to_verify, sig_bytes)
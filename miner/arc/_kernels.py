@@ -0,0 +1,39 @@
+"""
+Compiled kernels for the hot grid loops in the ARC solver
+Grids are int8 ndarrays (see EnhancedARCSolver.solve). Kernels are nogil, but
+the rest of a solve holds the GIL, so the worker threads in miner.handlers
+still mostly run one at a time; MINER_SOLVER_PROCESSES (a process pool) is
+what spreads solves across cores.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def detect_color_map(inp: np.ndarray, out: np.ndarray, color_map: np.ndarray) -> bool:
+    """
+    Extend color_map (length 10, -1 = unmapped) with the changed cells of one example
+    Returns False as soon as a color would map to two different colors, or
+    a changed cell holds a color outside 0-9
+    """
+    for i in range(inp.shape[0]):
+        for j in range(inp.shape[1]):
+            a = inp[i, j]
+            b = out[i, j]
+            if a != b:
+                if a < 0 or a > 9 or b < 0 or b > 9:
+                    return False
+                if color_map[a] != -1 and color_map[a] != b:
+                    return False
+                color_map[a] = b
+    return True
+
+
+def _warmup():
+    """Compile (or load from cache) every kernel so the first query doesn't pay JIT latency"""
+    grid = np.zeros((1, 1), dtype=np.int8)
+    detect_color_map(grid, grid, np.full(10, -1, dtype=np.int8))
+
+
+_warmup()
@@ -4,7 +4,9 @@ Implements sophisticated ARC solving strategies
 """
 
 from typing import List, Dict, Optional, Tuple, Set
+from functools import lru_cache
 import numpy as np
+from scipy import ndimage
 from collections import Counter
 
 
@@ -129,36 +131,35 @@ class AdvancedPatternDetector:
         return False
     
     @staticmethod
-    def _extract_objects(grid: List[List[int]]) -> List[Set[Tuple[int, int]]]:
-        """Extract connected components as objects"""
-        h, w = len(grid), len(grid[0])
-        visited = [[False] * w for _ in range(h)]
-        objects = []
+    def _extract_objects(grid: np.ndarray) -> List[Set[Tuple[int, int]]]:
+        """Extract connected components as objects (4-connected, single color, in scan order)"""
+        grid = np.asarray(grid)
         
-        def dfs(i, j, color, obj):
-            if i < 0 or i >= h or j < 0 or j >= w:
-                return
-            if visited[i][j] or grid[i][j] != color or grid[i][j] == 0:
-                return
-            
-            visited[i][j] = True
-            obj.add((i, j))
-            
-            # 4-connected
-            dfs(i+1, j, color, obj)
-            dfs(i-1, j, color, obj)
-            dfs(i, j+1, color, obj)
-            dfs(i, j-1, color, obj)
+        # Label each color separately so touching objects of different colors stay apart
+        labels = np.zeros(grid.shape, dtype=np.int32)
+        count = 0
+        for color in np.unique(grid[grid != 0]):
+            color_labels, n = ndimage.label(grid == color)
+            mask = color_labels > 0
+            labels[mask] = color_labels[mask] + count
+            count += n
+        
+        flat = labels.ravel()
+        cells = np.flatnonzero(flat)
+        if cells.size == 0:
+            return []
         
-        for i in range(h):
-            for j in range(w):
-                if not visited[i][j] and grid[i][j] != 0:
-                    obj = set()
-                    dfs(i, j, grid[i][j], obj)
-                    if obj:
-                        objects.append(obj)
+        # Group cells by label; the stable sort keeps each object's cells in scan order
+        cells = cells[np.argsort(flat[cells], kind='stable')]
+        starts = np.flatnonzero(np.diff(flat[cells], prepend=0))
+        ends = np.append(starts[1:], cells.size)
         
-        return objects
+        rows, cols = np.divmod(cells, grid.shape[1])
+        coords = list(zip(rows.tolist(), cols.tolist()))
+        
+        # Objects ordered by their first cell, as the old DFS scan found them
+        order = np.argsort(cells[starts])
+        return [set(coords[starts[k]:ends[k]]) for k in order.tolist()]
     
     @staticmethod
     def _objects_moved(objs1: List[Set], objs2: List[Set]) -> bool:
@@ -208,138 +209,103 @@ class AdvancedTransformations:
     """
     
     @staticmethod
-    def apply_gravity(grid: List[List[int]], direction: str = "down") -> List[List[int]]:
+    def apply_gravity(grid: np.ndarray, direction: str = "down") -> np.ndarray:
         """Apply gravity - make non-zero values fall"""
-        result = [[0] * len(grid[0]) for _ in range(len(grid))]
+        result = np.zeros_like(grid)
         
         if direction == "down":
-            for col in range(len(grid[0])):
-                # Collect non-zero values
-                values = [grid[row][col] for row in range(len(grid)) if grid[row][col] != 0]
-                # Place at bottom
-                for i, val in enumerate(reversed(values)):
-                    result[len(grid) - 1 - i][col] = val
+            h = grid.shape[0]
+            for col in range(grid.shape[1]):
+                # Collect non-zero values and place them at the bottom
+                values = grid[:, col][grid[:, col] != 0]
+                result[h - len(values):, col] = values
         
         return result
     
     @staticmethod
-    def remove_noise(grid: List[List[int]], noise_threshold: float = 0.1) -> List[List[int]]:
+    def remove_noise(grid: np.ndarray, noise_threshold: float = 0.1) -> np.ndarray:
         """Remove minority colors (noise)"""
-        color_counts = Counter(val for row in grid for val in row if val != 0)
-        
-        if not color_counts:
-            return [row[:] for row in grid]
+        color_counts = np.bincount(grid.ravel(), minlength=10)
+        color_counts[0] = 0
         
-        total = sum(color_counts.values())
-        noise_colors = {color for color, count in color_counts.items() 
-                       if count < total * noise_threshold}
+        total = color_counts.sum()
+        if total == 0:
+            return grid.copy()
         
-        return [[0 if val in noise_colors else val for val in row] for row in grid]
+        noise_colors = (color_counts > 0) & (color_counts < total * noise_threshold)
+        return np.where(noise_colors[grid], 0, grid).astype(grid.dtype)
     
     @staticmethod
-    def extract_frame(grid: List[List[int]]) -> List[List[int]]:
+    def extract_frame(grid: np.ndarray) -> np.ndarray:
         """Extract only the border/frame"""
-        result = [[0] * len(grid[0]) for _ in range(len(grid))]
-        
-        for i in range(len(grid)):
-            for j in range(len(grid[0])):
-                if i == 0 or i == len(grid)-1 or j == 0 or j == len(grid[0])-1:
-                    result[i][j] = grid[i][j]
-        
+        result = np.zeros_like(grid)
+        result[[0, -1], :] = grid[[0, -1], :]
+        result[:, [0, -1]] = grid[:, [0, -1]]
         return result
     
     @staticmethod
-    def fill_interior(grid: List[List[int]], fill_color: int = 1) -> List[List[int]]:
+    def fill_interior(grid: np.ndarray, fill_color: int = 1) -> np.ndarray:
         """Fill interior of shapes"""
-        result = [row[:] for row in grid]
-        h, w = len(grid), len(grid[0])
-        
-        # Flood fill from edges to mark exterior
-        exterior = [[False] * w for _ in range(h)]
-        
-        def flood_fill(i, j):
-            if i < 0 or i >= h or j < 0 or j >= w:
-                return
-            if exterior[i][j] or grid[i][j] != 0:
-                return
-            
-            exterior[i][j] = True
-            flood_fill(i+1, j)
-            flood_fill(i-1, j)
-            flood_fill(i, j+1)
-            flood_fill(i, j-1)
-        
-        # Start from edges
-        for i in range(h):
-            flood_fill(i, 0)
-            flood_fill(i, w-1)
-        for j in range(w):
-            flood_fill(0, j)
-            flood_fill(h-1, j)
+        result = grid.copy()
         
-        # Fill non-exterior zeros
-        for i in range(h):
-            for j in range(w):
-                if not exterior[i][j] and result[i][j] == 0:
-                    result[i][j] = fill_color
+        # Zero regions (4-connected, like a flood fill) that reach the border are exterior
+        labels, _ = ndimage.label(grid == 0)
+        exterior = np.unique(np.concatenate((labels[0], labels[-1], labels[:, 0], labels[:, -1])))
+        result[(labels > 0) & ~np.isin(labels, exterior)] = fill_color
         
         return result
     
     @staticmethod
-    def extract_largest_object(grid: List[List[int]]) -> List[List[int]]:
+    def extract_largest_object(grid: np.ndarray) -> np.ndarray:
         """Extract only the largest object"""
         objects = AdvancedPatternDetector._extract_objects(grid)
         
         if not objects:
-            return [row[:] for row in grid]
+            return grid.copy()
         
         largest = max(objects, key=len)
-        result = [[0] * len(grid[0]) for _ in range(len(grid))]
-        
-        for i, j in largest:
-            result[i][j] = grid[i][j]
+        rows, cols = zip(*largest)
+        result = np.zeros_like(grid)
+        result[rows, cols] = grid[rows, cols]
         
         return result
     
     @staticmethod
-    def mirror_complete(grid: List[List[int]]) -> List[List[int]]:
+    def mirror_complete(grid: np.ndarray) -> np.ndarray:
         """Complete pattern by mirroring"""
-        # Try horizontal mirror completion
-        result = [row[:] for row in grid]
-        w = len(grid[0])
-        
-        for i in range(len(grid)):
-            for j in range(w // 2):
-                if result[i][j] != 0 and result[i][w-1-j] == 0:
-                    result[i][w-1-j] = result[i][j]
-                elif result[i][w-1-j] != 0 and result[i][j] == 0:
-                    result[i][j] = result[i][w-1-j]
-        
-        return result
+        # Cached on the raw bytes so re-validating the same example is free
+        return _mirror_complete(grid.shape, grid.tobytes()).copy()
     
     @staticmethod
-    def apply_mask(grid: List[List[int]], mask_grid: List[List[int]]) -> List[List[int]]:
+    def apply_mask(grid: np.ndarray, mask_grid: np.ndarray) -> np.ndarray:
         """Apply mask - keep only where mask is non-zero"""
-        result = [[0] * len(grid[0]) for _ in range(len(grid))]
+        result = np.zeros_like(grid)
+        h = min(grid.shape[0], mask_grid.shape[0])
+        w = min(grid.shape[1], mask_grid.shape[1])
         
-        for i in range(min(len(grid), len(mask_grid))):
-            for j in range(min(len(grid[0]), len(mask_grid[0]))):
-                if mask_grid[i][j] != 0:
-                    result[i][j] = grid[i][j]
+        keep = mask_grid[:h, :w] != 0
+        result[:h, :w][keep] = grid[:h, :w][keep]
         
         return result
     
     @staticmethod
-    def replicate_pattern(grid: List[List[int]], times_h: int, times_w: int) -> List[List[int]]:
+    def replicate_pattern(grid: np.ndarray, times_h: int, times_w: int) -> np.ndarray:
         """Replicate pattern multiple times"""
-        h, w = len(grid), len(grid[0])
-        result = [[0] * (w * times_w) for _ in range(h * times_h)]
-        
-        for rep_i in range(times_h):
-            for rep_j in range(times_w):
-                for i in range(h):
-                    for j in range(w):
-                        result[rep_i * h + i][rep_j * w + j] = grid[i][j]
-        
-        return result
+        return np.tile(grid, (times_h, times_w))
+
 
+@lru_cache(maxsize=512)
+def _mirror_complete(shape: Tuple[int, int], data: bytes) -> np.ndarray:
+    """Horizontal mirror completion on an immutable grid"""
+    result = np.frombuffer(data, dtype=np.int8).reshape(shape).copy()
+    half = shape[1] // 2
+    
+    left = result[:, :half]
+    right = result[:, ::-1][:, :half]
+    
+    fill_right = (left != 0) & (right == 0)
+    fill_left = (right != 0) & (left == 0)
+    right[fill_right] = left[fill_right]
+    left[fill_left] = right[fill_left]
+    
+    return result
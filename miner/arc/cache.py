@@ -4,8 +4,8 @@ Caches solutions for similar/identical problems to improve efficiency score
 """
 
 import hashlib
-import json
 from typing import List, Dict, Optional
+import numpy as np
 from loguru import logger
 import time
 
@@ -23,22 +23,34 @@ class ARCCache:
         self.hits = 0
         self.misses = 0
         
-    def _hash_problem(self, train_examples: List[Dict], test_input: List[List[int]]) -> str:
+    @staticmethod
+    def _update_with_grid(h, grid: np.ndarray):
+        """Feed a grid's shape and raw bytes into a hash"""
+        grid = np.asarray(grid, dtype=np.int8)
+        h.update(repr(grid.shape).encode())
+        h.update(grid.tobytes())
+    
+    def _hash_pattern_into(self, h, train_examples: List[Dict]):
+        """Feed every training pair into a hash"""
+        for ex in train_examples:
+            self._update_with_grid(h, ex['input'])
+            self._update_with_grid(h, ex['output'])
+    
+    def _hash_problem(self, train_examples: List[Dict], test_input: np.ndarray) -> str:
         """Create hash of problem for cache key"""
-        # Convert to JSON string for hashing
-        problem_data = {
-            'train': train_examples,
-            'test': test_input
-        }
-        problem_str = json.dumps(problem_data, sort_keys=True)
-        return hashlib.sha256(problem_str.encode()).hexdigest()
+        h = hashlib.sha256()
+        self._hash_pattern_into(h, train_examples)
+        h.update(b'test')
+        self._update_with_grid(h, test_input)
+        return h.hexdigest()
     
     def _hash_pattern(self, train_examples: List[Dict]) -> str:
         """Hash only the pattern (for pattern-based caching)"""
-        pattern_str = json.dumps(train_examples, sort_keys=True)
-        return hashlib.sha256(pattern_str.encode()).hexdigest()
+        h = hashlib.sha256()
+        self._hash_pattern_into(h, train_examples)
+        return h.hexdigest()
     
-    def get(self, train_examples: List[Dict], test_input: List[List[int]]) -> Optional[List[List[int]]]:
+    def get(self, train_examples: List[Dict], test_input: np.ndarray) -> Optional[np.ndarray]:
         """Get cached solution if available"""
         # Try exact match first
         key = self._hash_problem(train_examples, test_input)
@@ -59,7 +71,7 @@ class ARCCache:
         self.misses += 1
         return None
     
-    def put(self, train_examples: List[Dict], test_input: List[List[int]], solution: List[List[int]]):
+    def put(self, train_examples: List[Dict], test_input: np.ndarray, solution: np.ndarray):
         """Store solution in cache"""
         key = self._hash_problem(train_examples, test_input)
         
@@ -113,12 +125,12 @@ class ARCCache:
 _global_cache = ARCCache(max_size=1000, ttl=3600)
 
 
-def get_cached_solution(train_examples: List[Dict], test_input: List[List[int]]) -> Optional[List[List[int]]]:
+def get_cached_solution(train_examples: List[Dict], test_input: np.ndarray) -> Optional[np.ndarray]:
     """Get solution from global cache"""
     return _global_cache.get(train_examples, test_input)
 
 
-def cache_solution(train_examples: List[Dict], test_input: List[List[int]], solution: List[List[int]]):
+def cache_solution(train_examples: List[Dict], test_input: np.ndarray, solution: np.ndarray):
     """Store solution in global cache"""
     _global_cache.put(train_examples, test_input, solution)
 
@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Any, List, Optional
+import numpy as np
 
 
 class TaskStatus(Enum):
@@ -13,11 +14,13 @@ class TaskStatus(Enum):
 class ARCTask:
     task_id: str
     problem_id: str
-    train_examples: List[Dict[str, List[List[int]]]]  # List of {"input": grid, "output": grid}
-    test_input: List[List[int]]
+    train_examples: List[Dict[str, np.ndarray]]  # List of {"input": grid, "output": grid}
+    test_input: np.ndarray
     timestamp: float
     num_train: int = 3
     status: TaskStatus = TaskStatus.PENDING
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    completed_at: Optional[float] = None
\ No newline at end of file
+    completed_at: Optional[float] = None
+    # Status-poll response, rebuilt by ARCTaskQueue whenever the task changes
+    _status_cache: Optional[Dict[str, Any]] = field(default=None, repr=False)
\ No newline at end of file
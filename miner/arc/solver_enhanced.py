@@ -40,17 +40,49 @@ PERFORMANCE METRICS:
 import os
 import re
 import json
+import functools
+import operator
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 from openai import OpenAI
 from loguru import logger
 import time
+import numpy as np
 from miner.arc.cache import get_cached_solution, cache_solution
 from miner.arc.advanced_patterns import AdvancedPatternDetector, AdvancedTransformations
+from miner.arc._kernels import detect_color_map
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# What limits each solve stage, so tuning targets the right technique:
+# interpreter/memory-bound stages want vectorization, network-bound ones
+# want concurrency, CPU-bound search wants compiled kernels
+STAGE_BOUNDS = {
+    "stage_0": "memory",       # cache lookup
+    "stage_1": "interpreter",  # quick patterns on tiny grids
+    "stage_2": "network",      # O3 round-trips
+    "stage_3": "cpu",          # advanced pattern search
+    "stage_4": "interpreter",  # fallback
+}
+STAGE_TIMING_WINDOW = 1000
+
+@dataclass
+class _ExampleFeatures:
+    """Per-grid features shared by the pattern predicates"""
+    color_counts: np.ndarray  # bincount over colors 0-9
+    nnz: int
+    colors: frozenset
+    sym_h: bool
+    sym_v: bool
+    bg: int
+    objects: Optional[list] = None  # connected components, extracted on first use
+
+
 class EnhancedARCSolver:
     """
     Production-grade ARC solver optimized for subnet scoring
@@ -84,33 +116,57 @@ class EnhancedARCSolver:
         # Pattern detection cache
         self.pattern_cache = {}
         
+        # id(grid) -> _ExampleFeatures; grids are never mutated in place after
+        # ingress, and entries are dropped when their grid is garbage collected
+        self._feature_cache: Dict[int, _ExampleFeatures] = {}
+        
         # Performance tracking
         self.solve_attempts = 0
         self.quick_pattern_hits = 0
         self.o3_successes = 0
         self.fallback_uses = 0
         
-    def solve(self, train_examples: List[Dict], test_input: List[List[int]]) -> List[List[int]]:
+        # Per-stage wall time (seconds), bounded so long-running miners don't grow it
+        self.stage_timings = {stage: deque(maxlen=STAGE_TIMING_WINDOW) for stage in STAGE_BOUNDS}
+        
+    def solve(self, train_examples: List[Dict], test_input: np.ndarray) -> np.ndarray:
         """
         Multi-strategy solver with intelligent routing
+        
+        Grids are int8 ndarrays end-to-end; nested lists are converted here
+        (a no-op for callers that already pass arrays)
         """
+        train_examples = [
+            {'input': np.asarray(ex['input'], dtype=np.int8), 'output': np.asarray(ex['output'], dtype=np.int8)}
+            for ex in train_examples
+        ]
+        test_input = np.asarray(test_input, dtype=np.int8)
+        return np.asarray(self._solve(train_examples, test_input), dtype=np.int8)
+    
+    def _solve(self, train_examples: List[Dict], test_input: np.ndarray) -> np.ndarray:
         start_time = time.time()
         self.solve_attempts += 1
         
-        if not train_examples or not test_input:
+        if not train_examples or test_input.size == 0:
             logger.warning("Empty input, returning test input as-is")
             return self._copy_grid(test_input)
         
+        # Scan every example grid once; predicates read these instead of rescanning
+        self._precompute_features([grid for ex in train_examples for grid in (ex['input'], ex['output'])])
+        
         # Strategy 0: Check cache first (maximum efficiency score!)
-        cached = get_cached_solution(train_examples, test_input)
-        if cached:
+        with self._stage_timer("stage_0"):
+            cached = get_cached_solution(train_examples, test_input)
+        if cached is not None:
             elapsed = time.time() - start_time
             logger.info(f"⚡ CACHED solution retrieved in {elapsed:.3f}s")
             return cached
         
         # Strategy 1: Quick pattern detection (for speed bonus)
-        quick_result = self._try_quick_patterns(train_examples, test_input)
-        if quick_result and self._validate_grid(quick_result):
+        with self._stage_timer("stage_1"):
+            quick_result = self._try_quick_patterns(train_examples, test_input)
+        quick_result = self._as_valid_grid(quick_result)
+        if quick_result is not None:
             self.quick_pattern_hits += 1
             elapsed = time.time() - start_time
             logger.info(f"✅ Quick pattern solved in {elapsed:.2f}s (hit rate: {self.quick_pattern_hits}/{self.solve_attempts})")
@@ -120,8 +176,10 @@ class EnhancedARCSolver:
         # Strategy 2: O3 with enhanced reasoning (with retry)
         if self.use_openai:
             try:
-                o3_result = self._solve_with_o3_enhanced(train_examples, test_input)
-                if o3_result and self._validate_grid(o3_result):
+                with self._stage_timer("stage_2"):
+                    o3_result = self._solve_with_o3_enhanced(train_examples, test_input)
+                o3_result = self._as_valid_grid(o3_result)
+                if o3_result is not None:
                     self.o3_successes += 1
                     elapsed = time.time() - start_time
                     logger.info(f"✅ O3 solved in {elapsed:.2f}s (success rate: {self.o3_successes}/{self.solve_attempts})")
@@ -130,8 +188,10 @@ class EnhancedARCSolver:
                 
                 # Retry with different approach if first attempt failed
                 logger.info("🔄 First O3 attempt failed, retrying...")
-                o3_result_retry = self._solve_with_o3_retry(train_examples, test_input)
-                if o3_result_retry and self._validate_grid(o3_result_retry):
+                with self._stage_timer("stage_2"):
+                    o3_result_retry = self._solve_with_o3_retry(train_examples, test_input)
+                o3_result_retry = self._as_valid_grid(o3_result_retry)
+                if o3_result_retry is not None:
                     self.o3_successes += 1
                     elapsed = time.time() - start_time
                     logger.info(f"✅ O3 solved on retry in {elapsed:.2f}s")
@@ -142,8 +202,10 @@ class EnhancedARCSolver:
                 logger.error(f"O3 solve failed: {e}")
         
         # Strategy 3: Advanced pattern analysis
-        advanced_result = self._advanced_pattern_solve(train_examples, test_input)
-        if advanced_result and self._validate_grid(advanced_result):
+        with self._stage_timer("stage_3"):
+            advanced_result = self._advanced_pattern_solve(train_examples, test_input)
+        advanced_result = self._as_valid_grid(advanced_result)
+        if advanced_result is not None:
             elapsed = time.time() - start_time
             logger.info(f"✅ Advanced pattern solved in {elapsed:.2f}s")
             cache_solution(train_examples, test_input, advanced_result)
@@ -151,16 +213,58 @@ class EnhancedARCSolver:
         
         # Strategy 4: Conservative fallback (maintains grid similarity)
         self.fallback_uses += 1
-        fallback_result = self._smart_fallback(train_examples, test_input)
+        with self._stage_timer("stage_4"):
+            fallback_result = self._smart_fallback(train_examples, test_input)
         elapsed = time.time() - start_time
         logger.info(f"⚠️  Using fallback strategy in {elapsed:.2f}s (fallback rate: {self.fallback_uses}/{self.solve_attempts})")
         
         # Cache the result for future
-        if fallback_result:
+        if fallback_result is not None:
             cache_solution(train_examples, test_input, fallback_result)
         
         return fallback_result
     
+    @contextmanager
+    def _stage_timer(self, stage: str):
+        """Record wall time of a solve stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_timings[stage].append(time.perf_counter() - start)
+    
+    def get_stats(self) -> Dict:
+        """Get solver routing counters and per-stage latency"""
+        stages = {}
+        for stage, timings in self.stage_timings.items():
+            samples = sorted(timings)
+            stages[stage] = {
+                'bound': STAGE_BOUNDS[stage],
+                'count': len(samples),
+                'median_ms': samples[len(samples) // 2] * 1000 if samples else None,
+                'p95_ms': samples[int(len(samples) * 0.95)] * 1000 if samples else None,
+            }
+        
+        return {
+            'solve_attempts': self.solve_attempts,
+            'quick_pattern_hits': self.quick_pattern_hits,
+            'o3_successes': self.o3_successes,
+            'fallback_uses': self.fallback_uses,
+            'stages': stages
+        }
+    
+    def warm_up(self):
+        """
+        Run the local solve stages once on a trivial problem so the first real
+        query doesn't pay first-call costs; skips the cache, O3 and stats
+        """
+        grid = np.zeros((1, 1), dtype=np.int8)
+        examples = [{'input': grid, 'output': grid.copy()}]
+        self._precompute_features([grid, examples[0]['output']])
+        self._try_quick_patterns(examples, grid)
+        self._advanced_pattern_solve(examples, grid)
+        self._smart_fallback(examples, grid)
+    
     def _try_quick_patterns(self, examples: List[Dict], test_input: List[List[int]]) -> Optional[List[List[int]]]:
         """
         Fast pattern detection for common transformations (speed optimization)
@@ -168,30 +272,42 @@ class EnhancedARCSolver:
         if not examples:
             return None
         
-        # Check for identity transform (input == output)
-        if all(self._grids_equal(ex['input'], ex['output']) for ex in examples):
-            return self._copy_grid(test_input)
-        
-        # Check for simple rotation (90°)
-        if all(self._is_rotation_90(ex['input'], ex['output']) for ex in examples):
-            return self._rotate_90(test_input)
-        
-        # Check for horizontal flip
-        if all(self._grids_equal(self._flip_horizontal(ex['input']), ex['output']) for ex in examples):
-            return self._flip_horizontal(test_input)
-        
-        # Check for vertical flip
-        if all(self._grids_equal(self._flip_vertical(ex['input']), ex['output']) for ex in examples):
-            return self._flip_vertical(test_input)
-        
-        # Check for 180° rotation
-        if all(self._is_rotation_180(ex['input'], ex['output']) for ex in examples):
-            return self._rotate_180(test_input)
-        
-        # Check for consistent color mapping
-        color_map = self._detect_color_mapping(examples)
-        if color_map:
-            return self._apply_color_map(test_input, color_map)
+        # Prune the detection tree by shape before running any cell-level check:
+        # identity/flips/180°/color map keep the shape, 90° rotation transposes it
+        shapes = [
+            ((len(ex['input']), len(ex['input'][0])), (len(ex['output']), len(ex['output'][0])))
+            for ex in examples
+        ]
+        same_shape = all(in_shape == out_shape for in_shape, out_shape in shapes)
+        transposed_shape = all(in_shape[::-1] == out_shape for in_shape, out_shape in shapes)
+        
+        if same_shape:
+            # Check for identity transform (input == output)
+            if all(self._grids_equal(ex['input'], ex['output']) for ex in examples):
+                return self._copy_grid(test_input)
+        
+        if transposed_shape:
+            # Check for simple rotation (90°)
+            if all(self._is_rotation_90(ex['input'], ex['output']) for ex in examples):
+                return self._rotate_90(test_input)
+        
+        if same_shape:
+            # Check for horizontal flip
+            if all(self._grids_equal(self._flip_horizontal(ex['input']), ex['output']) for ex in examples):
+                return self._flip_horizontal(test_input)
+            
+            # Check for vertical flip
+            if all(self._grids_equal(self._flip_vertical(ex['input']), ex['output']) for ex in examples):
+                return self._flip_vertical(test_input)
+            
+            # Check for 180° rotation
+            if all(self._is_rotation_180(ex['input'], ex['output']) for ex in examples):
+                return self._rotate_180(test_input)
+            
+            # Check for consistent color mapping
+            color_map = self._detect_color_mapping(examples)
+            if color_map:
+                return self._apply_color_map(test_input, color_map)
         
         # ADVANCED PATTERNS (with validation!)
         
@@ -387,7 +503,7 @@ Output grid:"""
             # Mirror completion
             if self._is_mirror_completion_pattern(examples):
                 result = AdvancedTransformations.mirror_complete(test_input)
-                if self._test_transformation_on_examples(examples, lambda x: AdvancedTransformations.mirror_complete(x)):
+                if self._test_transformation_on_examples(examples, AdvancedTransformations.mirror_complete):
                     logger.info("⚡ Detected & validated mirror completion")
                     return result
                 else:
@@ -396,7 +512,7 @@ Output grid:"""
             # Fill interior
             if self._is_fill_interior_pattern(examples):
                 result = AdvancedTransformations.fill_interior(test_input)
-                if self._test_transformation_on_examples(examples, lambda x: AdvancedTransformations.fill_interior(x)):
+                if self._test_transformation_on_examples(examples, AdvancedTransformations.fill_interior):
                     logger.info("⚡ Detected & validated fill interior")
                     return result
                 else:
@@ -405,7 +521,7 @@ Output grid:"""
             # Largest object extraction - DISABLED (too many false positives)
             # if self._is_object_filter_pattern(examples):
             #     result = AdvancedTransformations.extract_largest_object(test_input)
-            #     if self._test_transformation_on_examples(examples, lambda x: AdvancedTransformations.extract_largest_object(x)):
+            #     if self._test_transformation_on_examples(examples, AdvancedTransformations.extract_largest_object):
             #         logger.info("⚡ Detected & validated object filtering")
             #         return result
         except Exception as e:
@@ -423,7 +539,7 @@ Output grid:"""
         for strategy in strategies:
             try:
                 result = strategy(examples, test_input)
-                if result and self._validate_grid(result):
+                if result is not None and self._validate_grid(result):
                     return result
             except Exception as e:
                 continue
@@ -476,27 +592,29 @@ Output grid:"""
         if not examples:
             return "simple"
         
+        # One pass per example: (max input dim, size changed, color bitmask)
+        features = []
+        for ex in examples:
+            a = np.asarray(ex['input'], dtype=np.int8)
+            b = np.asarray(ex['output'], dtype=np.int8)
+            color_mask = (int(np.bitwise_or.reduce(np.left_shift(1, a, dtype=np.int16), axis=None)) |
+                          int(np.bitwise_or.reduce(np.left_shift(1, b, dtype=np.int16), axis=None)))
+            features.append((max(a.shape), a.shape != b.shape, color_mask))
+        
         # Check grid sizes
-        max_size = max(max(len(ex['input']), len(ex['input'][0])) for ex in examples)
+        max_size = max(f[0] for f in features)
         if max_size > 15:
             return "complex"
         
         # Check if size changes
-        size_changes = any(
-            len(ex['input']) != len(ex['output']) or 
-            len(ex['input'][0]) != len(ex['output'][0])
-            for ex in examples
-        )
+        size_changes = any(f[1] for f in features)
         if size_changes:
             return "complex"
         
         # Check color diversity
-        all_colors = set()
-        for ex in examples:
-            all_colors.update(val for row in ex['input'] for val in row)
-            all_colors.update(val for row in ex['output'] for val in row)
+        all_colors_mask = functools.reduce(operator.or_, (f[2] for f in features), 0)
         
-        if len(all_colors) > 6:
+        if all_colors_mask.bit_count() > 6:
             return "medium"
         
         return "simple"
@@ -635,24 +753,25 @@ Output grid:"""
         
         return None
     
-    def _resize_grid(self, grid: List[List[int]], target_h: int, target_w: int) -> List[List[int]]:
+    def _resize_grid(self, grid: np.ndarray, target_h: int, target_w: int) -> np.ndarray:
         """Resize grid intelligently"""
         current_h, current_w = len(grid), len(grid[0])
         
         if current_h == target_h and current_w == target_w:
             return grid
         
+        arr = np.asarray(grid, dtype=np.int8)
+        
         # If shrinking, crop from center
         if target_h <= current_h and target_w <= current_w:
             start_h = (current_h - target_h) // 2
             start_w = (current_w - target_w) // 2
-            return [row[start_w:start_w+target_w] for row in grid[start_h:start_h+target_h]]
+            return arr[start_h:start_h+target_h, start_w:start_w+target_w]
         
         # If expanding, pad with zeros
-        result = [[0] * target_w for _ in range(target_h)]
-        for i in range(min(current_h, target_h)):
-            for j in range(min(current_w, target_w)):
-                result[i][j] = grid[i][j]
+        result = np.zeros((target_h, target_w), dtype=np.int8)
+        copy_h, copy_w = min(current_h, target_h), min(current_w, target_w)
+        result[:copy_h, :copy_w] = arr[:copy_h, :copy_w]
         return result
     
     # ============= PATTERN-SPECIFIC SOLVERS =============
@@ -680,14 +799,8 @@ Output grid:"""
     
     def _solve_by_scaling(self, examples: List[Dict], test_input: List[List[int]]) -> Optional[List[List[int]]]:
         """Solve by scaling"""
-        scales = []
-        for ex in examples:
-            h_scale = len(ex['output']) / len(ex['input'])
-            w_scale = len(ex['output'][0]) / len(ex['input'][0])
-            scales.append((h_scale, w_scale))
-        
-        if len(set(scales)) == 1 and scales[0] != (1.0, 1.0):
-            h_scale, w_scale = scales[0]
+        h_scale, w_scale = self._get_consistent_scale(examples)
+        if h_scale is not None:
             return self._scale_grid(test_input, h_scale, w_scale)
         
         return None
@@ -696,12 +809,11 @@ Output grid:"""
         """Solve by tiling patterns"""
         # Check for tiling patterns
         for ex in examples:
-            if len(ex['output']) > len(ex['input']):
+            (in_h, in_w), (out_h, out_w) = ex['input'].shape, ex['output'].shape
+            if out_h > in_h:
                 # Might be tiling
                 if self._is_tiled(ex['input'], ex['output']):
-                    return self._tile_grid(test_input, 
-                                          len(ex['output']) // len(ex['input']),
-                                          len(ex['output'][0]) // len(ex['input'][0]))
+                    return self._tile_grid(test_input, out_h // in_h, out_w // in_w)
         return None
     
     def _solve_by_boundary_extraction(self, examples: List[Dict], test_input: List[List[int]]) -> Optional[List[List[int]]]:
@@ -713,54 +825,52 @@ Output grid:"""
     
     # ============= VALIDATION =============
     
-    def _validate_grid(self, grid: List[List[int]]) -> bool:
+    def _validate_grid(self, grid) -> bool:
         """Validate grid is proper"""
-        if not grid or not isinstance(grid, list):
-            return False
+        return self._as_valid_grid(grid) is not None
+    
+    def _as_valid_grid(self, grid) -> Optional[np.ndarray]:
+        """Return grid as an int8 array if it is a proper ARC grid, else None"""
+        if grid is None:
+            return None
         
-        if len(grid) == 0 or not grid[0]:
-            return False
+        try:
+            arr = np.asarray(grid)
+        except (ValueError, TypeError):
+            return None  # ragged rows
         
-        if len(grid) > 30 or len(grid[0]) > 30:
-            return False
+        if arr.ndim != 2 or arr.size == 0 or arr.shape[0] > 30 or arr.shape[1] > 30:
+            return None
         
-        row_len = len(grid[0])
-        for row in grid:
-            if not isinstance(row, list) or len(row) != row_len:
-                return False
-            for val in row:
-                if not isinstance(val, int) or val < 0 or val > 9:
-                    return False
+        if arr.dtype.kind not in 'iu' or arr.min() < 0 or arr.max() > 9:
+            return None
         
-        return True
+        return arr.astype(np.int8, copy=False)
     
     # ============= BASIC TRANSFORMS =============
     
-    def _copy_grid(self, grid: List[List[int]]) -> List[List[int]]:
-        return [row[:] for row in grid]
+    def _copy_grid(self, grid: np.ndarray) -> np.ndarray:
+        return grid.copy()
     
-    def _rotate_90(self, grid: List[List[int]]) -> List[List[int]]:
-        h, w = len(grid), len(grid[0])
-        return [[grid[h-1-i][j] for i in range(h)] for j in range(w)]
+    def _rotate_90(self, grid: np.ndarray) -> np.ndarray:
+        return np.rot90(grid, k=-1)
     
-    def _rotate_180(self, grid: List[List[int]]) -> List[List[int]]:
-        return [row[::-1] for row in grid[::-1]]
+    def _rotate_180(self, grid: np.ndarray) -> np.ndarray:
+        return np.rot90(grid, 2)
     
-    def _flip_horizontal(self, grid: List[List[int]]) -> List[List[int]]:
-        return [row[::-1] for row in grid]
+    def _flip_horizontal(self, grid: np.ndarray) -> np.ndarray:
+        return grid[:, ::-1]
     
-    def _flip_vertical(self, grid: List[List[int]]) -> List[List[int]]:
+    def _flip_vertical(self, grid: np.ndarray) -> np.ndarray:
         return grid[::-1]
     
-    def _grids_equal(self, g1: List[List[int]], g2: List[List[int]]) -> bool:
-        if len(g1) != len(g2) or len(g1[0]) != len(g2[0]):
-            return False
-        return all(g1[i][j] == g2[i][j] for i in range(len(g1)) for j in range(len(g1[0])))
+    # Shape check and element compare in one C call
+    _grids_equal = staticmethod(np.array_equal)
     
-    def _is_rotation_90(self, g1: List[List[int]], g2: List[List[int]]) -> bool:
+    def _is_rotation_90(self, g1: np.ndarray, g2: np.ndarray) -> bool:
         return self._grids_equal(self._rotate_90(g1), g2)
     
-    def _is_rotation_180(self, g1: List[List[int]], g2: List[List[int]]) -> bool:
+    def _is_rotation_180(self, g1: np.ndarray, g2: np.ndarray) -> bool:
         return self._grids_equal(self._rotate_180(g1), g2)
     
     def _detect_color_mapping(self, examples: List[Dict]) -> Optional[Dict[int, int]]:
@@ -768,39 +878,38 @@ Output grid:"""
         if not examples:
             return None
         
-        color_map = {}
+        color_map = np.full(10, -1, dtype=np.int8)
         for ex in examples:
-            if len(ex['input']) != len(ex['output']) or len(ex['input'][0]) != len(ex['output'][0]):
+            if ex['input'].shape != ex['output'].shape:
                 return None
             
-            for i in range(len(ex['input'])):
-                for j in range(len(ex['input'][0])):
-                    in_val = ex['input'][i][j]
-                    out_val = ex['output'][i][j]
-                    
-                    if in_val != out_val:
-                        if in_val in color_map and color_map[in_val] != out_val:
-                            return None  # Inconsistent
-                        color_map[in_val] = out_val
+            if not detect_color_map(ex['input'], ex['output'], color_map):
+                return None  # Inconsistent
         
-        return color_map if color_map else None
+        mapped = np.flatnonzero(color_map != -1)
+        return {int(k): int(color_map[k]) for k in mapped} if mapped.size else None
     
-    def _apply_color_map(self, grid: List[List[int]], color_map: Dict[int, int]) -> List[List[int]]:
+    def _apply_color_map(self, grid: np.ndarray, color_map: Dict[int, int]) -> np.ndarray:
         """Apply color mapping"""
-        return [[color_map.get(val, val) for val in row] for row in grid]
+        lut = np.arange(10, dtype=np.int8)
+        for k, v in color_map.items():
+            lut[k] = v
+        return lut[grid]
     
-    def _scale_grid(self, grid: List[List[int]], h_scale: float, w_scale: float) -> List[List[int]]:
-        """Scale grid by given factors"""
-        new_h = int(len(grid) * h_scale)
-        new_w = int(len(grid[0]) * w_scale)
+    def _scale_grid(self, grid: np.ndarray, h_scale: float, w_scale: float) -> np.ndarray:
+        """Scale grid by given factors (nearest neighbour)"""
+        # Integer factors, the only ones ARC really uses: plain block repeat
+        if h_scale == int(h_scale) and w_scale == int(w_scale):
+            return np.repeat(np.repeat(grid, int(h_scale), axis=0), int(w_scale), axis=1)
+        
+        h, w = grid.shape
+        rows = (np.arange(int(h * h_scale)) / h_scale).astype(np.intp)
+        cols = (np.arange(int(w * w_scale)) / w_scale).astype(np.intp)
         
-        result = [[0] * new_w for _ in range(new_h)]
-        for i in range(new_h):
-            for j in range(new_w):
-                orig_i = int(i / h_scale)
-                orig_j = int(j / w_scale)
-                if orig_i < len(grid) and orig_j < len(grid[0]):
-                    result[i][j] = grid[orig_i][orig_j]
+        # Source indices past the edge (float rounding) stay background
+        result = grid[np.minimum(rows, h - 1)][:, np.minimum(cols, w - 1)]
+        result[rows >= h, :] = 0
+        result[:, cols >= w] = 0
         
         return result
     
@@ -820,12 +929,8 @@ Output grid:"""
     def _is_tiled(self, input_grid, output_grid) -> bool:
         return False
     
-    def _tile_grid(self, grid, h_times, w_times):
-        result = []
-        for _ in range(h_times):
-            for row in grid:
-                result.append(row * w_times)
-        return result
+    def _tile_grid(self, grid: np.ndarray, h_times: int, w_times: int) -> np.ndarray:
+        return np.tile(grid, (h_times, w_times))
     
     def _is_boundary_extraction(self, input_grid, output_grid) -> bool:
         return False
@@ -833,53 +938,93 @@ Output grid:"""
     def _extract_boundary(self, grid):
         return None
     
+    def _features(self, grid: np.ndarray) -> _ExampleFeatures:
+        """Get (computing on first use) the cached features of a grid"""
+        features = self._feature_cache.get(id(grid))
+        if features is None:
+            self._precompute_features([grid])
+            features = self._feature_cache[id(grid)]
+        return features
+    
+    def _precompute_features(self, grids: List[np.ndarray]):
+        """Fill the feature cache, one stacked pass per distinct grid shape"""
+        groups: Dict[Tuple[int, int], Dict[int, np.ndarray]] = {}
+        for grid in grids:
+            if id(grid) not in self._feature_cache:
+                groups.setdefault(grid.shape, {})[id(grid)] = grid
+        
+        for batch in groups.values():
+            batch = list(batch.values())
+            stack = np.stack(batch)  # (N, H, W)
+            n = len(batch)
+            
+            # Offset each grid's colors into its own bin range: one bincount for the whole stack
+            bins = max(10, int(stack.max()) + 1) if stack.size else 10
+            offsets = (np.arange(n) * bins).reshape(n, 1, 1)
+            counts = np.bincount((stack + offsets).ravel(), minlength=n * bins).reshape(n, bins)
+            sym_h = (stack == stack[:, :, ::-1]).all(axis=(1, 2))
+            sym_v = (stack == stack[:, ::-1]).all(axis=(1, 2))
+            
+            for grid, color_counts, h, v in zip(batch, counts, sym_h, sym_v):
+                key = id(grid)
+                self._feature_cache[key] = _ExampleFeatures(
+                    color_counts=color_counts,
+                    nnz=int(grid.size - color_counts[0]),
+                    colors=frozenset(np.flatnonzero(color_counts).tolist()),
+                    sym_h=bool(h),
+                    sym_v=bool(v),
+                    bg=int(color_counts.argmax()),
+                )
+                # id() is only unique while the grid is alive
+                weakref.finalize(grid, self._feature_cache.pop, key, None)
+    
+    def _objects(self, grid: np.ndarray) -> list:
+        """Connected components of a grid, cached on its features"""
+        features = self._features(grid)
+        if features.objects is None:
+            features.objects = AdvancedPatternDetector._extract_objects(grid)
+        return features.objects
+    
     def _is_mirror_completion_pattern(self, examples: List[Dict]) -> bool:
         """Check if pattern involves mirror completion"""
         for ex in examples:
-            if len(ex['input']) != len(ex['output']) or len(ex['input'][0]) != len(ex['output'][0]):
+            if ex['input'].shape != ex['output'].shape:
                 return False
             
             # Check if output has more symmetry than input
-            out_symmetric = self._has_symmetry(ex['output'])
-            in_symmetric = self._has_symmetry(ex['input'])
-            
-            if out_symmetric and not in_symmetric:
+            if self._features(ex['output']).sym_h and not self._features(ex['input']).sym_h:
                 return True
         return False
     
     def _is_fill_interior_pattern(self, examples: List[Dict]) -> bool:
         """Check if pattern involves filling interiors"""
         for ex in examples:
-            if len(ex['input']) != len(ex['output']) or len(ex['input'][0]) != len(ex['output'][0]):
+            if ex['input'].shape != ex['output'].shape:
                 return False
             
             # Check if output has more non-zero cells than input
-            in_count = sum(1 for row in ex['input'] for val in row if val != 0)
-            out_count = sum(1 for row in ex['output'] for val in row if val != 0)
-            
-            if out_count > in_count * 1.2:
+            if self._features(ex['output']).nnz > self._features(ex['input']).nnz * 1.2:
                 return True
         return False
     
     def _is_object_filter_pattern(self, examples: List[Dict]) -> bool:
         """Check if pattern filters/selects specific objects"""
         for ex in examples:
-            in_objs = AdvancedPatternDetector._extract_objects(ex['input'])
-            out_objs = AdvancedPatternDetector._extract_objects(ex['output'])
+            in_objs = self._objects(ex['input'])
+            out_objs = self._objects(ex['output'])
             
             # If output has fewer objects, might be filtering
             if len(out_objs) < len(in_objs) and len(out_objs) > 0:
                 return True
         return False
     
-    def _has_symmetry(self, grid: List[List[int]]) -> bool:
-        """Check if grid has horizontal symmetry"""
-        w = len(grid[0])
-        for row in grid:
-            for j in range(w // 2):
-                if row[j] != row[w - 1 - j]:
-                    return False
-        return True
+    def _has_symmetry(self, grid: np.ndarray, kind: str = "horizontal") -> bool:
+        """Check if grid has horizontal (default), vertical or diagonal symmetry"""
+        if kind == "vertical":
+            return bool(np.array_equal(grid, grid[::-1]))
+        if kind == "diagonal":
+            return grid.shape[0] == grid.shape[1] and bool(np.array_equal(grid, grid.T))
+        return bool(np.array_equal(grid, grid[:, ::-1]))
     
     def _validate_pattern_against_examples(self, examples: List[Dict], pattern_name: str, test_result: List[List[int]]) -> bool:
         """
@@ -898,61 +1043,63 @@ Output grid:"""
         if not examples:
             return False
         
-        matches = 0
-        for ex in examples:
+        # Require 80% match rate: stop as soon as more than 20% have failed
+        fails_allowed = len(examples) // 5
+        # Smallest examples first so a bad transform is rejected on the cheapest grids
+        for ex in sorted(examples, key=lambda ex: ex['input'].size):
             try:
                 result = transform_func(ex['input'])
-                if self._grids_equal(result, ex['output']):
-                    matches += 1
-            except Exception as e:
-                continue
+                matched = self._grids_equal(result, ex['output'])
+            except Exception:
+                matched = False
+            if not matched:
+                fails_allowed -= 1
+                if fails_allowed < 0:
+                    return False
         
-        # Require 80% match rate
-        match_rate = matches / len(examples)
-        return match_rate >= 0.8
+        return True
     
     def _get_consistent_scale(self, examples: List[Dict]) -> Tuple[Optional[float], Optional[float]]:
         """Get consistent scaling factors if they exist"""
-        scales = []
+        first = None
         for ex in examples:
-            h_scale = len(ex['output']) / len(ex['input'])
-            w_scale = len(ex['output'][0]) / len(ex['input'][0])
-            scales.append((h_scale, w_scale))
-        
-        if len(set(scales)) == 1 and scales[0] != (1.0, 1.0):
-            return scales[0]
-        return None, None
+            (in_h, in_w), (out_h, out_w) = ex['input'].shape, ex['output'].shape
+            if first is None:
+                first = in_h, in_w, out_h, out_w
+            # Same ratio iff the cross products agree: exact integer compare, stop at the first mismatch
+            elif out_h * first[0] != first[2] * in_h or out_w * first[1] != first[3] * in_w:
+                return None, None
+        
+        if first is None or first[:2] == first[2:]:
+            return None, None
+        
+        # Whole factors come back as ints so _scale_grid takes its repeat path
+        in_h, in_w, out_h, out_w = first
+        return tuple(out // inp if out % inp == 0 else out / inp for out, inp in ((out_h, in_h), (out_w, in_w)))
     
     def _all_examples_reduce_colors(self, examples: List[Dict]) -> bool:
         """Check if all examples reduce number of colors"""
         for ex in examples:
-            in_colors = len(set(val for row in ex['input'] for val in row if val != 0))
-            out_colors = len(set(val for row in ex['output'] for val in row if val != 0))
+            in_colors = len(self._features(ex['input']).colors - {0})
+            out_colors = len(self._features(ex['output']).colors - {0})
             
             if out_colors >= in_colors:
                 return False
         return True
     
-    def _apply_dominant_color_pattern(self, grid: List[List[int]], examples: List[Dict]) -> List[List[int]]:
+    def _apply_dominant_color_pattern(self, grid: np.ndarray, examples: List[Dict]) -> np.ndarray:
         """Apply dominant color pattern from examples"""
-        # Find most common output color in examples
-        all_out_colors = []
-        for ex in examples:
-            colors = [val for row in ex['output'] for val in row if val != 0]
-            all_out_colors.extend(colors)
+        # Find most common non-zero output color in examples
+        counts = sum(self._features(ex['output']).color_counts for ex in examples)
+        counts[0] = 0
         
-        if not all_out_colors:
+        if not counts.any():
             return self._copy_grid(grid)
         
-        from collections import Counter
-        most_common_color = Counter(all_out_colors).most_common(1)[0][0]
+        most_common_color = counts.argmax()
         
         # Apply to test: keep structure but use most common color
-        result = []
-        for row in grid:
-            result.append([most_common_color if val != 0 else 0 for val in row])
-        
-        return result
+        return np.where(grid != 0, most_common_color, 0).astype(np.int8)
     
     def _resize_grid_smart(self, grid: List[List[int]], target_h: int, target_w: int, examples: List[Dict]) -> List[List[int]]:
         """
@@ -993,41 +1140,27 @@ Output grid:"""
         if not examples:
             return 0
         
-        # Count most common color in outputs
-        from collections import Counter
-        all_colors = []
-        for ex in examples:
-            all_colors.extend([val for row in ex['output'] for val in row])
-        
-        if not all_colors:
-            return 0
-        
-        # Background is usually the most common color
-        return Counter(all_colors).most_common(1)[0][0]
+        # Background is usually the most common color across outputs
+        counts = sum(self._features(ex['output']).color_counts for ex in examples)
+        return int(counts.argmax())
     
-    def _apply_example_color_pattern(self, grid: List[List[int]], examples: List[Dict]) -> List[List[int]]:
+    def _apply_example_color_pattern(self, grid: np.ndarray, examples: List[Dict]) -> np.ndarray:
         """
         Try to apply color transformation patterns observed in examples
         """
-        # Detect if there's a consistent color mapping
-        color_map = {}
+        # seen[a, b]: some same-shape example has a cell with input color a, output color b
+        seen = np.zeros((10, 10), dtype=bool)
         for ex in examples:
-            if len(ex['input']) == len(ex['output']) and len(ex['input'][0]) == len(ex['output'][0]):
-                for i in range(len(ex['input'])):
-                    for j in range(len(ex['input'][0])):
-                        in_val = ex['input'][i][j]
-                        out_val = ex['output'][i][j]
-                        if in_val in color_map and color_map[in_val] != out_val:
-                            # Inconsistent, can't apply
-                            return self._copy_grid(grid)
-                        color_map[in_val] = out_val
-        
-        if color_map:
-            # Apply the mapping
-            result = []
-            for row in grid:
-                result.append([color_map.get(val, val) for val in row])
-            return result
+            if ex['input'].shape == ex['output'].shape:
+                pairs = ex['input'].astype(np.intp).ravel() * 10 + ex['output'].ravel()
+                seen |= np.bincount(pairs, minlength=100).reshape(10, 10) > 0
+        
+        targets = seen.sum(axis=1)
+        if not targets.any() or (targets > 1).any():
+            # No mapping observed, or a color maps to two colors (inconsistent, can't apply)
+            return self._copy_grid(grid)
         
-        return self._copy_grid(grid)
+        # Unobserved colors map to themselves
+        lut = np.where(targets == 1, seen.argmax(axis=1), np.arange(10)).astype(np.int8)
+        return lut[grid]
 
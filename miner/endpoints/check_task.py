@@ -1,21 +1,20 @@
 from __future__ import annotations
 from fastapi import APIRouter, Request, HTTPException, Path
-from fastapi.responses import JSONResponse
-import json
-import os
+from fastapi.responses import Response
+import orjson
 from loguru import logger
 
 from common.epistula import Epistula
-from common.constants import CHECK_TASK_ENDPOINT
+from common.constants import CHECK_TASK_ENDPOINT, SKIP_EPISTULA_VERIFY
 from miner.handlers import handle_check_task
 
 router = APIRouter()
 
 @router.get(f"{CHECK_TASK_ENDPOINT}/{{task_id}}")
-async def check_task(request: Request, task_id: str = Path(..., description="Task ID to check")) -> JSONResponse:
+async def check_task(request: Request, task_id: str = Path(..., description="Task ID to check")) -> Response:
     """Check the status of a submitted task"""
     
-    if os.getenv("SKIP_EPISTULA_VERIFY", "false").lower() == "true":
+    if SKIP_EPISTULA_VERIFY:
         logger.warning("⚠️ EPISTULA VERIFICATION SKIPPED (TEST MODE)")
         
         task_status = handle_check_task(task_id)
@@ -23,9 +22,9 @@ async def check_task(request: Request, task_id: str = Path(..., description="Tas
         if not task_status:
             raise HTTPException(status_code=404, detail="Task not found")
         
-        return JSONResponse(
-            content={"data": task_status},
-            headers={"Content-Type": "application/json"}
+        return Response(
+            content=orjson.dumps({"data": task_status}),
+            media_type="application/json"
         )
     
     else:
@@ -53,7 +52,7 @@ async def check_task(request: Request, task_id: str = Path(..., description="Tas
             version=1
         )
         
-        return JSONResponse(
-            content=response_body,
+        return Response(
+            content=orjson.dumps(response_body),
             headers=response_headers
         )
\ No newline at end of file
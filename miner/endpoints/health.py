@@ -1,10 +1,9 @@
 from __future__ import annotations
 from fastapi import APIRouter, Request
-import os
 from loguru import logger
 
 from common.epistula import Epistula
-from common.constants import HEALTH_ENDPOINT
+from common.constants import HEALTH_ENDPOINT, SKIP_EPISTULA_VERIFY
 from miner.handlers import handle_health
 
 router = APIRouter()
@@ -12,7 +11,7 @@ router = APIRouter()
 @router.get(HEALTH_ENDPOINT)
 @router.post(HEALTH_ENDPOINT)
 async def health(request: Request):
-    if request.method == "GET" or os.getenv("SKIP_EPISTULA_VERIFY", "false").lower() == "true":
+    if request.method == "GET" or SKIP_EPISTULA_VERIFY:
         return {"status": "healthy"}
     
     body = await request.body()
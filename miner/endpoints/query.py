@@ -1,27 +1,31 @@
 from __future__ import annotations
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
-from typing import Any, Dict
-import json
-import os
+from fastapi.responses import Response
+import orjson
 from loguru import logger
 
 from common.epistula import Epistula
-from common.constants import QUERY_ENDPOINT
+from common.constants import QUERY_ENDPOINT, SKIP_EPISTULA_VERIFY
 from miner.handlers import handle_query
 
 router = APIRouter()
 
 @router.post(QUERY_ENDPOINT)
-async def query(request: Request, body: Dict[str, Any]) -> JSONResponse:
+async def query(request: Request) -> Response:
     """
     Accept a query and return a task ID for async processing
     """
     signature = request.headers.get("Body-Signature")
     
-    if os.getenv("SKIP_EPISTULA_VERIFY", "false").lower() == "true":
+    # Raw bytes as received; parsed at most once below
+    raw_body = await request.body()
+    
+    if SKIP_EPISTULA_VERIFY:
         logger.warning("⚠️ EPISTULA VERIFICATION SKIPPED (TEST MODE)")
-        parsed_body = body.copy()
+        try:
+            body = orjson.loads(raw_body)
+        except orjson.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
         if 'data' in body:
             query_data = body['data']
         else:
@@ -30,16 +34,15 @@ async def query(request: Request, body: Dict[str, Any]) -> JSONResponse:
         # test mode - create task and return task ID
         response_data = handle_query(request.app.state, query_data)
         
-        return JSONResponse(
-            content={"data": response_data},
-            headers={"Content-Type": "application/json"}
+        return Response(
+            content=orjson.dumps({"data": response_data}),
+            media_type="application/json"
         )
     else:
         if not signature:
             raise HTTPException(status_code=401, detail="Missing Body-Signature header")
         
-        body_bytes = json.dumps(body, sort_keys=True).encode('utf-8')
-        is_valid, error, parsed_body = Epistula.verify_request(body_bytes, signature)
+        is_valid, error, parsed_body = Epistula.verify_request(raw_body, signature)
         
         if not is_valid:
             raise HTTPException(status_code=401, detail=f"Invalid signature: {error}")
@@ -58,7 +61,7 @@ async def query(request: Request, body: Dict[str, Any]) -> JSONResponse:
             version=1
         )
         
-        return JSONResponse(
-            content=response_body,
+        return Response(
+            content=orjson.dumps(response_body),
             headers=response_headers
         )
\ No newline at end of file
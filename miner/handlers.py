@@ -1,9 +1,14 @@
 from __future__ import annotations
+import os
+import threading
 import time
 import uuid
+import multiprocessing as mp
 from typing import Dict, Any, Optional
 from loguru import logger
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
 
 from miner.arc.models import ARCTask, TaskStatus
 from miner.arc.solver_enhanced import EnhancedARCSolver
@@ -11,15 +16,59 @@ from miner.task_queue import ARCTaskQueue
 from miner.arc.cache import get_cache_stats
 
 
-_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ARCSolver")
+# Optional: solve in N worker processes instead of the worker threads (0 = in-thread)
+SOLVER_PROCESSES = int(os.getenv("MINER_SOLVER_PROCESSES", "0"))
+_NUM_WORKERS = max(2, SOLVER_PROCESSES)
+
+_executor = ThreadPoolExecutor(max_workers=max(4, _NUM_WORKERS), thread_name_prefix="ARCSolver")
 _solver = EnhancedARCSolver()
 _task_queue = ARCTaskQueue()
+_process_pool: Optional[ProcessPoolExecutor] = None
+# Serializes replacing a broken pool
+_pool_lock = threading.Lock()
+# False in pool children. Not mp.parent_process(): a spawned child imports this
+# module (to unpickle _solve_in_process) before that is set, but after its name is
+_IN_MAIN_PROCESS = mp.current_process().name == "MainProcess"
+
+
+def _solve_in_process(train_examples, test_input):
+    """Runs in a pool process, on the _solver inherited from (or re-created like) the parent"""
+    return _solver.solve(train_examples, test_input)
+
+
+def _new_process_pool(start_method: str) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=SOLVER_PROCESSES, mp_context=mp.get_context(start_method))
+
+
+def _replace_broken_pool(pool: ProcessPoolExecutor):
+    """Swap in a fresh pool for one whose child died; later tasks use the new one"""
+    global _process_pool
+    with _pool_lock:
+        if _process_pool is not pool:
+            return  # another worker already replaced it
+        logger.error("Solver process pool is broken (a child process died); starting a new one")
+        pool.shutdown(wait=False, cancel_futures=True)
+        # Worker threads are running by now, so don't fork
+        _process_pool = _new_process_pool("spawn")
+
+
+def _solve(train_examples, test_input):
+    pool = _process_pool
+    if pool is not None:
+        try:
+            return pool.submit(_solve_in_process, train_examples, test_input).result()
+        except BrokenProcessPool:
+            # Not retried in-thread: the input may be what killed the child
+            _replace_broken_pool(pool)
+            raise
+    return _solver.solve(train_examples, test_input)
 
 
 def _solve_task_worker():
     """Worker thread for solving tasks"""
     while True:
-        task = _task_queue.get_task(timeout=1.0)
+        # Block until a task arrives: no periodic wake-ups, and a task is picked up as soon as it is queued
+        task = _task_queue.get_task(timeout=None)
         if task:
             try:
                 logger.info(f"Processing task {task.task_id} (problem: {task.problem_id}, "
@@ -27,12 +76,12 @@ def _solve_task_worker():
                 
                 _task_queue.update_task_status(task.task_id, TaskStatus.PROCESSING)
                 
-                result = _solver.solve(task.train_examples, task.test_input)
+                result = _solve(task.train_examples, task.test_input)
                 
                 _task_queue.update_task_status(
                     task.task_id, 
                     TaskStatus.COMPLETED,
-                    result={"output": result, "cached": False}
+                    result={"output": result.tolist(), "cached": False}
                 )
                 
                 logger.info(f"Completed task {task.task_id}")
@@ -47,8 +96,27 @@ def _solve_task_worker():
                 )
 
 
-for _ in range(2):
-    _executor.submit(_solve_task_worker)
+try:
+    _solver.warm_up()
+except Exception as e:
+    logger.warning(f"Solver warm-up failed: {e}")
+
+# Pool children that re-import this module (spawn) must not start pools of their own
+if SOLVER_PROCESSES > 0 and _IN_MAIN_PROCESS:
+    # fork (where available) lets children inherit the warmed-up solver and compiled
+    # kernels copy-on-write. With fork every child is started on the first submit,
+    # so do that now, before any worker thread exists; spawn re-imports this module
+    # and relies on the numba on-disk cache instead
+    _start_method = "fork" if "fork" in mp.get_all_start_methods() else "spawn"
+    _process_pool = _new_process_pool(_start_method)
+    _process_pool.submit(int).result()
+    logger.info(f"Solving in {SOLVER_PROCESSES} {_start_method}ed processes "
+                f"(solver stats and solution cache are per process)")
+
+# Likewise, only the main process runs the task workers
+if _IN_MAIN_PROCESS:
+    for _ in range(_NUM_WORKERS):
+        _executor.submit(_solve_task_worker)
 
 
 def handle_health() -> Dict[str, Any]:
@@ -57,8 +125,9 @@ def handle_health() -> Dict[str, Any]:
     return {
         "status": "healthy",
         "timestamp": time.time(),
-        "queue_size": _task_queue.queue.qsize(),
+        "queue_size": _task_queue.qsize(),
         "solver_status": "operational",
+        "solver_stats": _solver.get_stats(),
         "cache_stats": cache_stats
     }
 
@@ -108,6 +177,27 @@ def handle_query(state: Any, query_data: Dict[str, Any]) -> Dict[str, Any]:
             logger.error(f"Invalid training example {i} for problem {problem_id}: input/output not lists")
             return {"error": f"Invalid training example {i}: input/output not lists"}
     
+    # Convert grids once at ingress; the solver works on int8 arrays throughout
+    try:
+        train_examples = [
+            {"input": np.asarray(ex["input"], dtype=np.int8), "output": np.asarray(ex["output"], dtype=np.int8)}
+            for ex in train_examples
+        ]
+        test_input = np.asarray(test_input, dtype=np.int8)
+    except (ValueError, TypeError, OverflowError) as e:
+        logger.error(f"Invalid grid for problem {problem_id}: {e}")
+        return {"error": f"Invalid grid: {e}"}
+    
+    if test_input.ndim != 2 or any(ex["input"].ndim != 2 or ex["output"].ndim != 2 for ex in train_examples):
+        logger.error(f"Invalid grid for problem {problem_id}: grids must be 2D")
+        return {"error": "Invalid grid: grids must be 2D"}
+
+    # int8 conversion only rejects values outside -128..127; colors are 0-9
+    grids = [test_input] + [g for ex in train_examples for g in (ex["input"], ex["output"])]
+    if any(g.size == 0 or g.min() < 0 or g.max() > 9 for g in grids):
+        logger.error(f"Invalid grid for problem {problem_id}: empty grid or color outside 0-9")
+        return {"error": "Invalid grid: grids must be non-empty with colors 0-9"}
+
     task_id = str(uuid.uuid4())
     
     task = ARCTask(
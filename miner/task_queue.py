@@ -1,87 +1,119 @@
-from queue import Queue, Empty
-from threading import Lock
+from threading import Lock, Condition
+from collections import OrderedDict, deque
 from miner.arc.models import ARCTask, TaskStatus
 from typing import Dict, Any, Optional
 import time
 
+# Power of two so a shard is picked with a mask
+NUM_SHARDS = 16
+
+_TERMINAL = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED})
+
+
+class _TaskShard:
+    """One slice of the task map, with its own lock"""
+    
+    __slots__ = ("lock", "tasks", "completed")
+    
+    def __init__(self):
+        self.lock = Lock()
+        self.tasks: Dict[str, ARCTask] = {}  # task_id -> ARCTask
+        # Finished task ids, oldest completion first: the eviction order
+        self.completed: "OrderedDict[str, float]" = OrderedDict()
+
 
 class ARCTaskQueue:
     """Thread-safe task queue for managing ARC problems"""
     
     def __init__(self, max_size: int = 100, max_stored_results: int = 1000):
-        self.queue = Queue(maxsize=max_size)
-        self.tasks = {}  # task_id -> ARCTask
-        self.tasks_lock = Lock()
+        # Pending tasks; one condition guards the deque and wakes workers
+        self._pending: deque = deque()
+        self._not_empty = Condition(Lock())
+        self.max_size = max_size
+        # Tasks are sharded by task_id so pollers, workers and producers
+        # touching different tasks don't serialize on one lock
+        self._shards = [_TaskShard() for _ in range(NUM_SHARDS)]
         self.max_stored_results = max_stored_results
-        
+        # Tasks stored across all shards; only add_task changes it, under _not_empty
+        self._num_stored = 0
+    
+    def _shard(self, task_id: str) -> _TaskShard:
+        return self._shards[hash(task_id) & (NUM_SHARDS - 1)]
+    
     def add_task(self, task: ARCTask) -> bool:
-        try:
-            with self.tasks_lock:
-                self.tasks[task.task_id] = task
-                self._cleanup_old_tasks()
-            
-            self.queue.put_nowait(task)
-            return True
-        except:
-            return False
+        """Store and enqueue a task; False if the pending queue is full"""
+        shard = self._shard(task.task_id)
+        # Not visible to other threads yet, so build outside the locks
+        task._status_cache = self._build_status(task)
+        with self._not_empty:
+            if len(self._pending) >= self.max_size:
+                return False
+            with shard.lock:
+                shard.tasks[task.task_id] = task
+                self._num_stored += 1
+                self._cleanup_old_tasks(shard)
+            self._pending.append(task)
+            self._not_empty.notify()
+        return True
+    
+    def get_task(self, timeout: Optional[float] = 1.0) -> Optional[ARCTask]:
+        """Pop the next task, waiting up to timeout seconds (forever if None)"""
+        with self._not_empty:
+            if not self._pending and not self._not_empty.wait_for(lambda: self._pending, timeout):
+                return None
+            return self._pending.popleft()
     
-    def get_task(self, timeout: float = 1.0) -> Optional[ARCTask]:
-        try:
-            return self.queue.get(timeout=timeout)
-        except Empty:
-            return None
+    def qsize(self) -> int:
+        return len(self._pending)
     
     def update_task_status(self, task_id: str, status: TaskStatus, result: Dict = None, error: str = None):
-        with self.tasks_lock:
-            if task_id in self.tasks:
-                task = self.tasks[task_id]
+        shard = self._shard(task_id)
+        with shard.lock:
+            if task_id in shard.tasks:
+                task = shard.tasks[task_id]
                 task.status = status
                 if result is not None:
                     task.result = result
                 if error is not None:
                     task.error = error
-                if status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
+                if status in _TERMINAL:
                     task.completed_at = time.time()
+                    shard.completed[task_id] = task.completed_at
+                    shard.completed.move_to_end(task_id)
+                task._status_cache = self._build_status(task)
     
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
-        with self.tasks_lock:
-            if task_id not in self.tasks:
-                return None
-            
-            task = self.tasks[task_id]
-            response = {
-                "task_id": task.task_id,
-                "status": task.status.value,
-                "created_at": task.timestamp,
-                "problem_id": task.problem_id,
-            }
-            
-            if task.completed_at:
-                response["completed_at"] = task.completed_at
-                
-            if task.status == TaskStatus.COMPLETED and task.result:
-                response["result"] = task.result
-            elif task.status == TaskStatus.FAILED and task.error:
-                response["error"] = task.error
-                
-            return response
+        """Status response for a task (shared, read-only), or None if unknown"""
+        shard = self._shard(task_id)
+        with shard.lock:
+            task = shard.tasks.get(task_id)
+            return task._status_cache if task is not None else None
     
-    def _cleanup_old_tasks(self):
-        """Remove old completed tasks"""
-        if len(self.tasks) <= self.max_stored_results:
-            return
-        
-        completed_tasks = [
-            (task_id, task.completed_at) 
-            for task_id, task in self.tasks.items() 
-            if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED] and task.completed_at
-        ]
+    @staticmethod
+    def _build_status(task: ARCTask) -> Dict[str, Any]:
+        response = {
+            "task_id": task.task_id,
+            "status": task.status.value,
+            "created_at": task.timestamp,
+            "problem_id": task.problem_id,
+        }
         
-        if not completed_tasks:
-            return
+        if task.completed_at:
+            response["completed_at"] = task.completed_at
         
-        completed_tasks.sort(key=lambda x: x[1])
-        to_remove = len(self.tasks) - self.max_stored_results
+        if task.status == TaskStatus.COMPLETED and task.result:
+            response["result"] = task.result
+        elif task.status == TaskStatus.FAILED and task.error:
+            response["error"] = task.error
         
-        for task_id, _ in completed_tasks[:to_remove]:
-            del self.tasks[task_id]
+        return response
+    
+    def _cleanup_old_tasks(self, shard: _TaskShard):
+        """
+        Remove old completed tasks from one shard once the queue as a whole holds
+        more than max_stored_results (caller holds _not_empty and the shard's lock)
+        """
+        while self._num_stored > self.max_stored_results and shard.completed:
+            task_id, _ = shard.completed.popitem(last=False)
+            shard.tasks.pop(task_id, None)
+            self._num_stored -= 1
@@ -1,21 +1,33 @@
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 
-from fastapi import FastAPI, status
-from pydantic import BaseModel
+import msgspec
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse, Response
 from loguru import logger
 
 import db
 
+try:
+    # uvicorn --loop uvloop already does this; covers other launchers
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await db.init_pool()
+    db.start_writers()
     logger.info("API ready.")
     try:
         yield
     finally:
+        await db.stop_writers()
         await db.close_pool()
         logger.info("API shutdown complete.")
 
@@ -23,11 +35,12 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="Validator Telemetry API",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
 
-class HeartbeatIn(BaseModel):
+class HeartbeatIn(msgspec.Struct):
     ts: datetime
     version: str
     cycle_count: Optional[int] = None
@@ -35,24 +48,40 @@ class HeartbeatIn(BaseModel):
     wallet_hotkey: Optional[str] = None
 
 
-class MinerMetricsDetails(BaseModel):
+class MinerMetricsDetails(msgspec.Struct):
     exact_match: bool
     partial_correctness: float
     grid_similarity: float
     efficiency_score: float
 
 
-class MinerMetricsIn(BaseModel):
+class MinerMetricsIn(msgspec.Struct):
     ts: datetime
     block: int
     uid: int
     problem_id: str
     success: bool
     response_time: float  # seconds
-    metrics: MinerMetricsDetails
-
-
-class BatchSummaryIn(BaseModel):
+    exact_match: Optional[bool] = None
+    partial_correctness: Optional[float] = None
+    grid_similarity: Optional[float] = None
+    efficiency_score: Optional[float] = None
+    # Legacy wire format nests the four metrics; lifted to the top level on decode
+    metrics: Optional[MinerMetricsDetails] = None
+
+    def __post_init__(self):
+        if self.metrics is not None:
+            self.exact_match = self.metrics.exact_match
+            self.partial_correctness = self.metrics.partial_correctness
+            self.grid_similarity = self.metrics.grid_similarity
+            self.efficiency_score = self.metrics.efficiency_score
+            self.metrics = None
+        if None in (self.exact_match, self.partial_correctness, self.grid_similarity, self.efficiency_score):
+            # Raised to the caller as a msgspec.ValidationError
+            raise ValueError("missing metrics: exact_match, partial_correctness, grid_similarity, efficiency_score")
+
+
+class BatchSummaryIn(msgspec.Struct):
     ts: datetime
     block: int
     num_miners: int
@@ -62,28 +91,38 @@ class BatchSummaryIn(BaseModel):
     exact_matches: int
 
 
+# Bodies are decoded straight from the raw bytes; non-strict keeps the
+# lax coercions (e.g. "3" -> 3) the previous pydantic models accepted
+_heartbeat_decoder = msgspec.json.Decoder(HeartbeatIn, strict=False)
+_miner_metrics_decoder = msgspec.json.Decoder(MinerMetricsIn, strict=False)
+_batch_summary_decoder = msgspec.json.Decoder(BatchSummaryIn, strict=False)
+
+# Pull a body's fields out as a row tuple in the writer's column order
+_heartbeat_row = attrgetter("ts", "version", "cycle_count", "netuid", "wallet_hotkey")
+_miner_metrics_row = attrgetter(*db.MINER_METRICS_COLUMNS)
+_batch_summary_row = attrgetter(
+    "ts", "block", "num_miners", "num_problems", "total_queries", "successful", "exact_matches"
+)
+
+
+async def _decode(request: Request, decoder: msgspec.json.Decoder):
+    try:
+        return decoder.decode(await request.body())
+    except msgspec.DecodeError as e:  # includes ValidationError
+        raise HTTPException(status_code=422, detail=str(e))
+
+
 @app.post(
     "/validator/heartbeat",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
 )
-async def ingest_heartbeat(body: HeartbeatIn):
+async def ingest_heartbeat(request: Request):
     """
     Validator heartbeat: version, cycle, etc.
     """
-    query = """
-        INSERT INTO validator_heartbeat
-            (ts, version, cycle_count, netuid, wallet_hotkey)
-        VALUES ($1, $2, $3, $4, $5)
-    """
-
-    await db.execute(
-        query,
-        body.ts,
-        body.version,
-        body.cycle_count,
-        body.netuid,
-        body.wallet_hotkey,
-    )
+    body: HeartbeatIn = await _decode(request, _heartbeat_decoder)
+    db.heartbeats.put(_heartbeat_row(body))
 
     return
 
@@ -91,35 +130,14 @@ async def ingest_heartbeat(body: HeartbeatIn):
 @app.post(
     "/validator/ingest_miner_metrics",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
 )
-async def ingest_miner_metrics(body: MinerMetricsIn):
+async def ingest_miner_metrics(request: Request):
     """
     Per miner/problem result.
     """
-    query = """
-        INSERT INTO miner_metrics
-            (ts, block, uid, problem_id, success,
-             response_time,
-             exact_match,
-             partial_correctness,
-             grid_similarity,
-             efficiency_score)
-        VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10)
-    """
-
-    await db.execute(
-        query,
-        body.ts,
-        body.block,
-        body.uid,
-        body.problem_id,
-        body.success,
-        body.response_time,
-        body.metrics.exact_match,
-        body.metrics.partial_correctness,
-        body.metrics.grid_similarity,
-        body.metrics.efficiency_score,
-    )
+    body: MinerMetricsIn = await _decode(request, _miner_metrics_decoder)
+    db.miner_metrics.put(_miner_metrics_row(body))
 
     return
 
@@ -127,31 +145,21 @@ async def ingest_miner_metrics(body: MinerMetricsIn):
 @app.post(
     "/validator/batch_summary",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
 )
-async def ingest_batch_summary(body: BatchSummaryIn):
+async def ingest_batch_summary(request: Request):
     """
     Aggregated stats per cycle / batch.
     """
-    query = """
-        INSERT INTO batch_summary
-            (ts, block,
-             num_miners,
-             num_problems,
-             total_queries,
-             successful,
-             exact_matches)
-        VALUES ($1,$2,$3,$4,$5,$6,$7)
-    """
-
-    await db.execute(
-        query,
-        body.ts,
-        body.block,
-        body.num_miners,
-        body.num_problems,
-        body.total_queries,
-        body.successful,
-        body.exact_matches,
-    )
+    body: BatchSummaryIn = await _decode(request, _batch_summary_decoder)
+    db.batch_summaries.put(_batch_summary_row(body))
 
     return
+
+
+@app.get("/health")
+async def health():
+    """
+    Liveness plus write-queue depth; a growing "dropped" means rows are being shed.
+    """
+    return {"status": "ok", "queues": db.writer_stats()}
@@ -1,9 +1,142 @@
+# asyncpg runs on both the default asyncio loop and uvloop (what the API image uses)
 import os
+import asyncio
 import asyncpg
 from loguru import logger
 
 _pool = None
 
+# Rows are flushed once a batch is full or its first row has waited this long
+BATCH_MAX_ROWS = 500
+BATCH_MAX_WAIT = 0.02  # seconds
+# Batches at least this big go through binary COPY (where the writer has columns)
+COPY_MIN_ROWS = 100
+# Rows waiting per writer before new ones are dropped
+BATCH_QUEUE_MAX = int(os.getenv("TELEMETRY_QUEUE_MAX", "10000"))
+
+
+HEARTBEAT_SQL = """
+    INSERT INTO validator_heartbeat
+        (ts, version, cycle_count, netuid, wallet_hotkey)
+    VALUES ($1, $2, $3, $4, $5)
+"""
+
+MINER_METRICS_SQL = """
+    INSERT INTO miner_metrics
+        (ts, block, uid, problem_id, success,
+         response_time,
+         exact_match,
+         partial_correctness,
+         grid_similarity,
+         efficiency_score)
+    VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10)
+"""
+MINER_METRICS_COLUMNS = (
+    "ts", "block", "uid", "problem_id", "success",
+    "response_time",
+    "exact_match",
+    "partial_correctness",
+    "grid_similarity",
+    "efficiency_score",
+)
+
+BATCH_SUMMARY_SQL = """
+    INSERT INTO batch_summary
+        (ts, block,
+         num_miners,
+         num_problems,
+         total_queries,
+         successful,
+         exact_matches)
+    VALUES ($1,$2,$3,$4,$5,$6,$7)
+"""
+
+
+class BatchWriter:
+    """
+    Buffers rows for one INSERT and writes them from a background task,
+    many rows per round-trip and transaction
+    """
+
+    def __init__(self, query: str, table: str, columns: tuple = None):
+        self.query = query
+        # Target table; COPY also needs columns, in the same order as query
+        self.table = table
+        self.columns = columns
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=BATCH_QUEUE_MAX)
+        self.dropped = 0
+        self._task = None
+
+    def put(self, row: tuple) -> bool:
+        """Queue a row without waiting; telemetry is lossy, so a full queue drops it"""
+        try:
+            self.queue.put_nowait(row)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning(f"{self.table} write queue full, {self.dropped} rows dropped so far")
+            return False
+
+    def stats(self) -> dict:
+        return {"queued": self.queue.qsize(), "dropped": self.dropped}
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Write out everything queued so far, then stop the drainer"""
+        await self.queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + BATCH_MAX_WAIT
+            while len(batch) < BATCH_MAX_ROWS:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._write(batch)
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} telemetry rows: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def _write(self, batch):
+        if self.columns is not None and len(batch) >= COPY_MIN_ROWS:
+            # COPY skips per-row INSERT parsing and execution overhead
+            await copy_records(self.table, self.columns, batch)
+        else:
+            await executemany(self.query, batch)
+
+
+heartbeats = BatchWriter(HEARTBEAT_SQL, "validator_heartbeat")
+miner_metrics = BatchWriter(MINER_METRICS_SQL, "miner_metrics", MINER_METRICS_COLUMNS)
+batch_summaries = BatchWriter(BATCH_SUMMARY_SQL, "batch_summary")
+
+_writers = (heartbeats, miner_metrics, batch_summaries)
+
+
+async def _init_conn(conn):
+    """Parse and cache the writers' INSERTs on each new connection, before its first lease"""
+    for writer in _writers:
+        # executemany with no rows only prepares the statement (into the statement cache)
+        await conn.executemany(writer.query, [])
+
 
 async def init_pool():
     global _pool
@@ -14,10 +147,21 @@ async def init_pool():
     if not db_url:
         raise RuntimeError("DATABASE_URL not set")
 
+    # Writes go through the batch writers, one connection each at a time,
+    # so keep that many connections open rather than reconnecting after idle gaps.
+    # create_pool connects (and runs _init_conn on) all min_size connections
+    # before returning, so lifespan only logs "API ready." once they are live.
+    # Every uvicorn worker gets its own pool: size DB_POOL_MAX at about
+    # Postgres max_connections / UVICORN_WORKERS.
     _pool = await asyncpg.create_pool(
         db_url,
-        min_size=1,
-        max_size=10,
+        min_size=int(os.getenv("DB_POOL_MIN", str(len(_writers)))),
+        max_size=int(os.getenv("DB_POOL_MAX", "10")),
+        max_inactive_connection_lifetime=0,
+        # The same few INSERTs run all day: keep them prepared for the connection's lifetime
+        statement_cache_size=256,
+        max_cached_statement_lifetime=0,
+        init=_init_conn,
         timeout=3.0,
     )
     logger.info("Postgres pool initialized")
@@ -32,9 +176,43 @@ async def close_pool():
         _pool = None
 
 
+def start_writers():
+    for writer in _writers:
+        writer.start()
+
+
+async def stop_writers():
+    for writer in _writers:
+        await writer.stop()
+
+
+def writer_stats() -> dict:
+    """Backlog and drop counts per table, for spotting a DB that can't keep up"""
+    return {writer.table: writer.stats() for writer in _writers}
+
+
 async def execute(query: str, *args):
     if _pool is None:
         raise RuntimeError("DB pool not initialized")
 
     async with _pool.acquire() as conn:
         await conn.execute(query, *args)
+
+
+async def executemany(query: str, rows):
+    """Run query once per row on one pooled connection, in a single transaction"""
+    if _pool is None:
+        raise RuntimeError("DB pool not initialized")
+
+    async with _pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.executemany(query, rows)
+
+
+async def copy_records(table: str, columns, rows):
+    """Bulk-load rows into table with binary COPY on one pooled connection"""
+    if _pool is None:
+        raise RuntimeError("DB pool not initialized")
+
+    async with _pool.acquire() as conn:
+        await conn.copy_records_to_table(table, records=rows, columns=columns)
@@ -1,14 +1,22 @@
+import heapq
 import os
-import random
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from urllib.parse import urlparse
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, List
+from typing import Dict, List
 
+import numpy as np
 import psycopg2
+import psycopg2.pool
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from scalecodec.base import ScaleBytes
 from substrateinterface import SubstrateInterface
 
 REFERENCE_VALIDATOR = "5GZ2KuT2TtLbYTtsMcgAtazo6KQ4bc57ykZgyQv9oit3y7iq"
@@ -47,25 +55,91 @@ def human_delta(ms_then: int | None, ms_now: int | None) -> str:
     return " ".join(parts)
 
 
-def connect_substrate(endpoint: str = DEFAULT_ENDPOINT):
+def connect_substrate(endpoint: str = DEFAULT_ENDPOINT, metadata_cache=None):
     if SubstrateInterface is None:
         raise RuntimeError("substrate-interface not installed (chain unavailable)")
     return SubstrateInterface(
         url=endpoint,
         ss58_format=SS58_FORMAT,
         use_remote_preset=True,
+        cache_region=metadata_cache,
     )
 
 
-def read_weights_by_uid(substrate: SubstrateInterface, netuid: int, uid: int):
-    q = substrate.query("SubtensorModule", "Weights", [netuid, uid])
-    vals = q.value or []
-    return [(int(dest), int(w)) for dest, w in vals]
+class MetadataCache:
+    """
+    In-process stand-in for the dogpile region substrate-interface accepts as
+    cache_region: decoded runtime metadata, keyed by spec version
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, object] = {}
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def set(self, key, value):
+        self._entries[key] = value
+
+
+class SubstratePool:
+    """
+    Open chain connections to one endpoint, kept across reruns and sessions.
+    A connection serves one caller at a time; extra ones are opened on demand.
+    """
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self._idle: List[SubstrateInterface] = []
+        self._lock = threading.Lock()
+        self._storage_keys: Dict[tuple, object] = {}
+        # Runtime metadata is by far the largest download when a connection
+        # starts up; later connections take it from here instead
+        self._metadata = MetadataCache()
+
+    @contextmanager
+    def connection(self):
+        with self._lock:
+            substrate = self._idle.pop() if self._idle else None
+        if substrate is not None and not _is_connected(substrate):
+            substrate.close()
+            substrate = None
+        if substrate is None:
+            substrate = connect_substrate(self.endpoint, self._metadata)
+        try:
+            yield substrate
+        except Exception:
+            # State of the socket is unknown after a failed call: don't reuse it
+            substrate.close()
+            raise
+        with self._lock:
+            self._idle.append(substrate)
+
+    def storage_key(self, substrate: SubstrateInterface, pallet: str, storage_function: str, params=()):
+        """substrate.create_storage_key, memoized so the params are SCALE-encoded once"""
+        cache_key = (pallet, storage_function, tuple(params))
+        key = self._storage_keys.get(cache_key)
+        if key is None:
+            key = substrate.create_storage_key(pallet, storage_function, list(params))
+            self._storage_keys[cache_key] = key
+        return key
+
+
+def _is_connected(substrate: SubstrateInterface) -> bool:
+    ws = getattr(substrate, "websocket", None)
+    return ws is None or bool(getattr(ws, "connected", False))
+
+
+@st.cache_resource(show_spinner=False)
+def get_substrate_pool(endpoint: str = DEFAULT_ENDPOINT) -> SubstratePool:
+    return SubstratePool(endpoint)
 
 
-def get_last_update_block(substrate: SubstrateInterface, netuid: int, uid: int) -> int | None:
-    q = substrate.query("SubtensorModule", "LastUpdate", [netuid], block_hash=None)
-    arr = q.value
+def _parse_weights(vals):
+    return [(int(dest), int(w)) for dest, w in (vals or [])]
+
+
+def _pick_last_update(arr, uid: int) -> int | None:
     if not arr or uid >= len(arr):
         return None
     try:
@@ -77,13 +151,27 @@ def get_last_update_block(substrate: SubstrateInterface, netuid: int, uid: int)
             return None
 
 
-def get_block_timestamp(substrate: SubstrateInterface, block_number: int) -> int | None:
+def query_values(substrate: SubstrateInterface, storage_keys, block_hash: str | None = None) -> list:
+    """Values of several storage keys from one state_queryStorageAt round trip, in input order"""
+    by_key = {
+        key.to_hex(): obj.value
+        for key, obj in substrate.query_multi(storage_keys, block_hash=block_hash)
+    }
+    return [by_key.get(key.to_hex()) for key in storage_keys]
+
+
+def get_block_timestamp(substrate: SubstrateInterface, block_number: int, now_key=None) -> int | None:
     if block_number is None:
         return None
     try:
         block_hash = substrate.get_block_hash(block_number)
         if block_hash is None:
             return None
+        if now_key is not None:
+            # Timestamp.Now is a plain u64, so read the pre-built key directly:
+            # query() would first load that older block's header and runtime version
+            data = substrate.rpc_request("state_getStorage", [now_key.to_hex(), block_hash]).get("result")
+            return int(now_key.decode_scale_value(ScaleBytes(data)).value) if data else None
         ts_q = substrate.query("Timestamp", "Now", block_hash=block_hash)
         ts = ts_q.value
         return int(ts) if ts is not None else None
@@ -91,48 +179,32 @@ def get_block_timestamp(substrate: SubstrateInterface, block_number: int) -> int
         return None
 
 
-def get_current_block_and_timestamp(substrate: SubstrateInterface) -> tuple[int | None, int | None]:
-    header = substrate.get_block_header()
-    try:
-        current_block = int(header["header"]["number"])
-    except Exception:
-        current_block = None
-    ts_q = substrate.query("Timestamp", "Now")
-    current_ts = int(ts_q.value) if ts_q and ts_q.value is not None else None
-    return current_block, current_ts
-
-
-def get_validator_uid(substrate: SubstrateInterface, netuid: int, hotkey: str) -> int | None:
-    try:
-        q = substrate.query("SubtensorModule", "Uids", [netuid, hotkey])
-        if q and q.value is not None:
-            return int(q.value)
-        return None
-    except Exception:
-        return None
+@st.cache_resource(ttl=300, show_spinner=False)
+def _known_hotkeys() -> Dict[tuple, str]:
+    """(netuid, uid) -> hotkey, shared by every resolve; emptied every 5 minutes as UIDs get re-registered"""
+    return {}
 
 
-def get_hotkey_for_uid(substrate: SubstrateInterface, netuid: int, uid: int) -> Optional[str]:
-    try:
-        q = substrate.query("SubtensorModule", "Keys", [netuid, uid])
-        if q and q.value is not None:
-            return str(q.value)
-        return None
-    except Exception:
-        return None
-
-
-@st.cache_data(show_spinner=False)
+@st.cache_data(ttl=300, show_spinner=False)
 def resolve_hotkeys_for_uids(uids: List[int], netuid: int = DEFAULT_NETUID, endpoint: str = DEFAULT_ENDPOINT) -> Dict[int, str]:
-    out: Dict[int, str] = {}
+    known = _known_hotkeys()
+    out: Dict[int, str] = {uid: known[(netuid, uid)] for uid in uids if (netuid, uid) in known}
+    missing = [uid for uid in uids if uid not in out]
+    if not missing:
+        return out
     try:
-        substrate = connect_substrate(endpoint)
+        pool = get_substrate_pool(endpoint)
+        with pool.connection() as substrate:
+            # All Keys entries in one state_queryStorageAt instead of a query per UID
+            hotkeys = query_values(
+                substrate,
+                [pool.storage_key(substrate, "SubtensorModule", "Keys", (netuid, uid)) for uid in missing],
+            )
     except Exception:
         return out
-    for uid in uids:
-        hk = get_hotkey_for_uid(substrate, netuid, uid)
+    for uid, hk in zip(missing, hotkeys):
         if hk:
-            out[uid] = hk
+            out[uid] = known[(netuid, uid)] = str(hk)
     return out
 
 
@@ -179,13 +251,45 @@ def summarize_last_set_time(
     }
 
 
+def _batch_validator_rpc(pool: SubstratePool, substrate: SubstrateInterface, netuid: int, uid: int) -> dict:
+    """Head block plus Weights, LastUpdate and Timestamp.Now, read in a single storage query"""
+    # Every read is pinned to one head hash: substrate-interface re-resolves the
+    # head and its runtime (three more RPCs) for each call made with block_hash=None
+    block_hash = substrate.get_chain_head()
+    header = substrate.get_block_header(block_hash=block_hash)
+    try:
+        current_block = int(header["header"]["number"])
+    except Exception:
+        current_block = None
+    weights, last_update, now = query_values(
+        substrate,
+        [
+            pool.storage_key(substrate, "SubtensorModule", "Weights", (netuid, uid)),
+            pool.storage_key(substrate, "SubtensorModule", "LastUpdate", (netuid,)),
+            pool.storage_key(substrate, "Timestamp", "Now"),
+        ],
+        block_hash=block_hash,
+    )
+    return {
+        "current_block": current_block,
+        "current_ts_ms": int(now) if now is not None else None,
+        "weights": _parse_weights(weights),
+        "last_block": _pick_last_update(last_update, uid),
+    }
+
+
 def fetch_validator_weights_info(uid: int, netuid: int, endpoint: str, top_n: int = 25):
     try:
-        substrate = connect_substrate(endpoint)
-        current_block, current_ts_ms = get_current_block_and_timestamp(substrate)
-        weights = read_weights_by_uid(substrate, netuid, uid)
-        last_block = get_last_update_block(substrate, netuid, uid)
-        last_ts_ms = get_block_timestamp(substrate, last_block)
+        pool = get_substrate_pool(endpoint)
+        with pool.connection() as substrate:
+            chain = _batch_validator_rpc(pool, substrate, netuid, uid)
+            last_ts_ms = get_block_timestamp(
+                substrate, chain["last_block"], pool.storage_key(substrate, "Timestamp", "Now")
+            )
+        current_block = chain["current_block"]
+        current_ts_ms = chain["current_ts_ms"]
+        weights = chain["weights"]
+        last_block = chain["last_block"]
         timing = summarize_last_set_time(
             last_block=last_block,
             last_ts_ms=last_ts_ms,
@@ -193,20 +297,11 @@ def fetch_validator_weights_info(uid: int, netuid: int, endpoint: str, top_n: in
             current_ts_ms=current_ts_ms,
             avg_block_seconds=12.0,
         )
-        weights_sorted = sorted(weights, key=lambda x: x[1], reverse=True)
-        total = sum(w for _, w in weights_sorted) or 1
-        top_rows = []
-        for dest_uid, w in weights_sorted[:top_n]:
-            share = w / total
-            top_rows.append(
-                {
-                    "dest_uid": dest_uid,
-                    "weight_ticks": w,
-                    "share": share,
-                    "percent": share * 100.0,
-                }
-            )
-        weights_df = pd.DataFrame(top_rows)
+        total = sum(w for _, w in weights) or 1
+        top = heapq.nlargest(top_n, weights, key=lambda x: x[1])
+        weights_df = pd.DataFrame(top, columns=["dest_uid", "weight_ticks"])
+        weights_df["share"] = weights_df["weight_ticks"] / total
+        weights_df["percent"] = weights_df["share"] * 100.0
         info = {
             "current_block": current_block,
             "current_ts_human": fmt_ts(current_ts_ms),
@@ -221,17 +316,30 @@ def fetch_validator_weights_info(uid: int, netuid: int, endpoint: str, top_n: in
         return None, str(e)
 
 
-def summarize_last_set_weights_for_hotkey(hotkey: str, endpoint: str = DEFAULT_ENDPOINT):
-    try:
-        substrate = connect_substrate(endpoint)
-    except Exception:
-        return {"last_ts_human": "unknown", "time_since": "unknown"}
-    uid = get_validator_uid(substrate, DEFAULT_NETUID, hotkey)
+def summarize_last_set_weights_for_hotkey(hotkey: str, substrate: SubstrateInterface, keys: SubstratePool):
+    # One head for all reads, so the runtime is only looked up once
+    block_hash = substrate.get_chain_head()
+    # LastUpdate and Timestamp.Now keys are the same for every validator and come
+    # ready-encoded from the pool; all three head reads share one round trip
+    uid, last_update, now = query_values(
+        substrate,
+        [
+            keys.storage_key(substrate, "SubtensorModule", "Uids", (DEFAULT_NETUID, hotkey)),
+            keys.storage_key(substrate, "SubtensorModule", "LastUpdate", (DEFAULT_NETUID,)),
+            keys.storage_key(substrate, "Timestamp", "Now"),
+        ],
+        block_hash=block_hash,
+    )
     if uid is None:
         return {"last_ts_human": "unknown", "time_since": "unknown"}
-    current_block, current_ts_ms = get_current_block_and_timestamp(substrate)
-    last_block = get_last_update_block(substrate, DEFAULT_NETUID, uid)
-    last_ts_ms = get_block_timestamp(substrate, last_block)
+    header = substrate.get_block_header(block_hash=block_hash)
+    try:
+        current_block = int(header["header"]["number"])
+    except Exception:
+        current_block = None
+    current_ts_ms = int(now) if now is not None else None
+    last_block = _pick_last_update(last_update, int(uid))
+    last_ts_ms = get_block_timestamp(substrate, last_block, keys.storage_key(substrate, "Timestamp", "Now"))
     timing = summarize_last_set_time(
         last_block=last_block,
         last_ts_ms=last_ts_ms,
@@ -245,41 +353,65 @@ def summarize_last_set_weights_for_hotkey(hotkey: str, endpoint: str = DEFAULT_E
     }
 
 
+def iter_last_set_weights_for_hotkeys(
+    hotkeys: List[str], endpoint: str = DEFAULT_ENDPOINT, max_workers: int = 8
+):
+    """
+    summarize_last_set_weights_for_hotkey for each hotkey, fanned out over threads;
+    yields (index into hotkeys, summary) as each one finishes
+    """
+    if not hotkeys:
+        return
+    # Each worker takes its own pooled connection: one can't be shared between threads
+    substrates = get_substrate_pool(endpoint)
+
+    def summarize(hotkey: str):
+        try:
+            with substrates.connection() as substrate:
+                return summarize_last_set_weights_for_hotkey(hotkey, substrate, substrates)
+        except Exception:
+            return {"last_ts_human": "unknown", "time_since": "unknown"}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(hotkeys))) as pool:
+        futures = {pool.submit(summarize, hotkey): i for i, hotkey in enumerate(hotkeys)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
 def _mock_now():
     return datetime.utcnow()
 
 
+# Mock frames are built once per process: cheap page loads, and filters don't
+# reshuffle the random values between reruns
+@st.cache_data(show_spinner=False)
 def _mock_overview_df():
-    rows = []
+    rng = np.random.default_rng()
     base_block = 100000
-    uids = [101, 202, 303]
-    for uid in uids:
-        for i in range(80):
-            ts = _mock_now() - timedelta(minutes=i)
-            block = base_block + i
-            response_time = random.uniform(0.05, 0.8)
-            exact_flag = random.random() < 0.4 + (0.2 if uid == 202 else 0.0)
-            partial_correctness = random.uniform(0.2, 0.95)
-            grid_similarity = random.uniform(0.3, 0.99)
-            efficiency_score = random.uniform(0.4, 1.0)
-            rows.append(
-                {
-                    "ts": ts,
-                    "block": block,
-                    "uid": uid,
-                    "problem_id": f"prob-{uid}-{i}",
-                    "success": True,
-                    "response_time": response_time,
-                    "exact_match": exact_flag,
-                    "partial_correctness": partial_correctness,
-                    "grid_similarity": grid_similarity,
-                    "efficiency_score": efficiency_score,
-                    "accuracy": 1 if exact_flag else 0,
-                }
-            )
-    return pd.DataFrame(rows)
+    uids = np.array([101, 202, 303])
+    per_uid = 80
+    n = len(uids) * per_uid
+    uid = np.repeat(uids, per_uid)
+    i = np.tile(np.arange(per_uid), len(uids))
+    exact_flag = rng.random(n) < 0.4 + np.where(uid == 202, 0.2, 0.0)
+    return pd.DataFrame(
+        {
+            "ts": pd.Timestamp(_mock_now()) - pd.to_timedelta(i, unit="m"),
+            "block": base_block + i,
+            "uid": uid,
+            "problem_id": [f"prob-{u}-{k}" for u, k in zip(uid, i)],
+            "success": np.ones(n, dtype=bool),
+            "response_time": rng.uniform(0.05, 0.8, n),
+            "exact_match": exact_flag,
+            "partial_correctness": rng.uniform(0.2, 0.95, n),
+            "grid_similarity": rng.uniform(0.3, 0.99, n),
+            "efficiency_score": rng.uniform(0.4, 1.0, n),
+            "accuracy": exact_flag.astype(int),
+        }
+    )
 
 
+@st.cache_data(show_spinner=False)
 def _mock_validator_versions_df():
     latest_version = "v1.3.7"
     data = [
@@ -344,9 +476,9 @@ def _mock_miner_stats_df(df_overview, uid):
 
 
 def _mock_recent_for_miner(df_overview, uid, limit=50):
-    d = df_overview[df_overview["uid"] == uid].copy()
+    # accuracy is already an int column in the mock frame
+    d = df_overview[df_overview["uid"] == uid]
     d = d.sort_values("ts", ascending=False).head(limit)
-    d["accuracy"] = d["accuracy"].astype(int)
     return d[
         [
             "ts",
@@ -358,39 +490,70 @@ def _mock_recent_for_miner(df_overview, uid, limit=50):
             "grid_similarity",
             "efficiency_score",
         ]
-    ]
+    ].astype(RECENT_SAMPLES_DTYPES)
+
+
+# Upper bound on any dashboard query, so one slow scan can't pin a connection
+STATEMENT_TIMEOUT_MS = 15000
 
 
 @st.cache_resource(show_spinner=False)
-def get_db_connection():
+def get_db_pool():
+    """Connections shared by all sessions; each query borrows one for its duration"""
     db_url = os.getenv("DATABASE_URL")
     if not db_url:
         return None
     try:
         parsed = urlparse(db_url)
-        conn = psycopg2.connect(
+        return psycopg2.pool.ThreadedConnectionPool(
+            2,
+            int(os.getenv("DB_POOL_MAX", "10")),
             dbname=parsed.path.lstrip("/"),
             user=parsed.username,
             password=parsed.password,
             host=parsed.hostname,
             port=parsed.port or 5432,
+            options=f"-c statement_timeout={STATEMENT_TIMEOUT_MS}",
         )
-        conn.autocommit = True
-        return conn
     except Exception as e:
         print(f"[dashboard] Failed DB connect, mock mode: {e}")
         return None
 
 
-def sql_df(query, params=None):
-    conn = get_db_connection()
-    if conn is None:
+def sql_df(query, params=None, dtypes=None):
+    """Run query and return the rows as a DataFrame, with the given column dtypes when known"""
+    pool = get_db_pool()
+    if pool is None:
         raise RuntimeError("DB not available")
-    with conn.cursor() as cur:
-        cur.execute(query, params or [])
-        cols = [desc[0] for desc in cur.description]
-        rows = cur.fetchall()
-    return pd.DataFrame(rows, columns=cols)
+    conn = pool.getconn()
+    try:
+        if not conn.autocommit:
+            conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(query, params or [])
+            cols = [desc[0] for desc in cur.description]
+            rows = cur.fetchall()
+    finally:
+        # A connection that died mid-query is dropped rather than handed out again
+        pool.putconn(conn, close=bool(conn.closed))
+    # coerce_float turns NUMERIC (Decimal) results such as AVG(int) into floats
+    df = pd.DataFrame.from_records(rows, columns=cols, coerce_float=True)
+    if dtypes:
+        df = df.astype(dtypes)
+    return df
+
+
+# get_miner_recent_samples' columns, in the order the miner page shows them;
+# problem_ids repeat across a miner's samples, so they're stored as a category
+RECENT_SAMPLES_DTYPES = {
+    "block": "int64",
+    "problem_id": "category",
+    "accuracy": "int8",
+    "response_time": "float32",
+    "partial_correctness": "float32",
+    "grid_similarity": "float32",
+    "efficiency_score": "float32",
+}
 
 
 def get_miners_list(full_df_overview=None):
@@ -403,43 +566,57 @@ def get_miners_list(full_df_overview=None):
         return []
 
 
-def get_overview_data(days_window: int, selected_miners):
+# Dashboard queries are cached briefly so widget changes and reruns don't all hit
+# Postgres; each page's Refresh button clears its own.
+DATA_TTL = 30  # seconds
+VERSIONS_TTL = 300  # seconds
+
+def _mock_overview_window(days_window: int, selected_miners):
+    df = _mock_overview_df()
+    cutoff = datetime.utcnow() - timedelta(days=days_window)
+    df = df[df["ts"] >= cutoff]
+    if selected_miners:
+        df = df[df["uid"].isin(selected_miners)]
+    return df
+
+
+def _aggregate_overview(df):
+    return (
+        df.groupby("uid", as_index=False)
+        .agg(
+            avg_latency_s=("response_time", "mean"),
+            accuracy=("accuracy", "mean"),
+            queries=("uid", "size"),
+        )
+    )
+
+
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def get_overview_agg(days_window: int, selected_miners):
+    """Per-miner latency, exact-match rate and query count over the window, one row per UID"""
     try:
-        base_q = """
+        # Aggregated by Postgres: only one row per miner comes back
+        q = """
             SELECT
-                ts,
-                block,
                 uid,
-                problem_id,
-                success,
-                response_time,
-                exact_match,
-                partial_correctness,
-                grid_similarity,
-                efficiency_score
+                AVG(response_time) AS avg_latency_s,
+                AVG(exact_match::int)::float8 AS accuracy,
+                COUNT(*) AS queries
             FROM miner_metrics
             WHERE ts >= NOW() - (%s || ' days')::interval
         """
         params = [str(days_window)]
         if selected_miners:
-            base_q += " AND uid = ANY(%s)"
+            q += " AND uid = ANY(%s)"
             params.append(selected_miners)
-        base_q += " ORDER BY ts DESC LIMIT 5000"
-        df = sql_df(base_q, params)
-        if df.empty:
-            return df
-        df["accuracy"] = df["exact_match"].astype(int)
-        return df
+        q += " GROUP BY uid ORDER BY uid"
+        return sql_df(q, params, dtypes={"uid": "int32", "queries": "int64"})
     except Exception:
-        df = _mock_overview_df()
-        cutoff = datetime.utcnow() - timedelta(days=days_window)
-        df = df[df["ts"] >= cutoff]
-        if selected_miners:
-            df = df[df["uid"].isin(selected_miners)]
-        return df
+        return _aggregate_overview(_mock_overview_window(days_window, selected_miners))
 
 
-def get_miner_stats(uid, fallback_df=None):
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def get_miner_stats(uid, _fallback_df=None):
     try:
         q = """
             SELECT
@@ -457,19 +634,20 @@ def get_miner_stats(uid, fallback_df=None):
         df = sql_df(q, [uid])
         return df
     except Exception:
-        if fallback_df is None or fallback_df.empty:
-            fallback_df = _mock_overview_df()
-        return _mock_miner_stats_df(fallback_df, uid)
+        if _fallback_df is None or _fallback_df.empty:
+            _fallback_df = _mock_overview_df()
+        return _mock_miner_stats_df(_fallback_df, uid)
 
 
-def get_miner_recent_samples(uid, limit=50, fallback_df=None):
+@st.cache_data(ttl=DATA_TTL, show_spinner=False)
+def get_miner_recent_samples(uid, limit=50, _fallback_df=None):
     try:
         q = """
             SELECT
                 ts,
                 block,
                 problem_id,
-                exact_match,
+                exact_match::int AS accuracy,
                 response_time,
                 partial_correctness,
                 grid_similarity,
@@ -479,16 +657,14 @@ def get_miner_recent_samples(uid, limit=50, fallback_df=None):
             ORDER BY ts DESC
             LIMIT %s
         """
-        df = sql_df(q, [uid, limit])
-        if not df.empty:
-            df["accuracy"] = df["exact_match"].astype(int)
-        return df
+        return sql_df(q, [uid, limit], dtypes=RECENT_SAMPLES_DTYPES)
     except Exception:
-        if fallback_df is None or fallback_df.empty:
-            fallback_df = _mock_overview_df()
-        return _mock_recent_for_miner(fallback_df, uid, limit=limit)
+        if _fallback_df is None or _fallback_df.empty:
+            _fallback_df = _mock_overview_df()
+        return _mock_recent_for_miner(_fallback_df, uid, limit=limit)
 
 
+@st.cache_data(ttl=VERSIONS_TTL, show_spinner=False)
 def get_validator_versions():
     try:
         q = """
@@ -516,9 +692,17 @@ def get_validator_versions():
         return df, latest_version
 
 
+_SEMVER_RE = re.compile(r"[vV]?(\d+)(?:\.(\d+))?(?:\.(\d+))?")
+
+
+@lru_cache(maxsize=256)
 def parse_semver(v: str | None):
     if not v:
         return None
+    m = _SEMVER_RE.fullmatch(v)
+    if m:
+        return tuple(int(p) if p else 0 for p in m.groups())
+    # Anything else (extra parts, non-numeric parts) takes the general path
     v = v.lstrip("vV")
     parts = v.split(".")
     out = []
@@ -558,6 +742,7 @@ def page_overview():
     top_row = st.columns([1, 5, 1])
     with top_row[0]:
         if st.button("Refresh data"):
+            get_overview_agg.clear()
             st.rerun()
 
     control_row = st.columns([1, 2])
@@ -580,24 +765,17 @@ def page_overview():
             default=[],
         )
 
-    df = get_overview_data(days_window, selected_miners)
+    agg = get_overview_agg(days_window, selected_miners)
 
-    if df.empty:
+    if agg.empty:
         st.warning("No data found for this selection yet.")
         return
 
-    agg = (
-        df.groupby("uid", as_index=False)
-        .agg(
-            avg_latency_s=("response_time", "mean"),
-            accuracy=("accuracy", "mean"),
-            queries=("uid", "size"),
-        )
-    )
-
     uid_list = agg["uid"].tolist()
     hotkey_map = resolve_hotkeys_for_uids(uid_list)
-    agg["hotkey"] = agg["uid"].map(lambda u: hotkey_map.get(u, ""))
+    agg["hotkey"] = agg["uid"].map(lambda u: hotkey_map.get(u, "")).astype("string[pyarrow]")
+    # Arrow-backed strings: the search below runs on Arrow's compute kernels
+    agg["uid_str"] = agg["uid"].astype("string[pyarrow]")
 
     search_term = st.text_input(
         "Search by UID or hotkey (live filter)",
@@ -606,14 +784,14 @@ def page_overview():
     )
 
     if search_term:
-        s = str(search_term).lower()
+        s = str(search_term)
         mask = (
-            agg["uid"].astype(str).str.contains(s, case=False)
-            | agg["hotkey"].astype(str).str.lower().str.contains(s, case=False)
+            agg["uid_str"].str.contains(s, case=False, regex=False)
+            | agg["hotkey"].str.contains(s, case=False, regex=False)
         )
-        agg_filtered = agg[mask].copy()
+        agg_filtered = agg[mask]
     else:
-        agg_filtered = agg.copy()
+        agg_filtered = agg
 
     st.subheader("Accuracy vs Latency (Per Miner)")
     st.caption("Each point is one miner UID. Accuracy = mean(exact_match). Latency = mean(response_time in s).")
@@ -626,7 +804,7 @@ def page_overview():
             x="avg_latency_s",
             y="accuracy",
             size="queries",
-            color=agg_filtered["uid"].astype(str),
+            color="uid_str",
             hover_data=[
                 "uid",
                 "hotkey",
@@ -638,7 +816,7 @@ def page_overview():
                 "avg_latency_s": "Avg Latency (s)",
                 "accuracy": "Exact Match Rate",
                 "queries": "# Queries",
-                "color": "Miner UID",
+                "uid_str": "Miner UID",
             },
             title="Miner Accuracy vs Latency",
         )
@@ -647,24 +825,13 @@ def page_overview():
     st.markdown("---")
 
     st.subheader("Miner summary table")
-    nice_table = agg_filtered.copy()
-    nice_table["accuracy_pct"] = (nice_table["accuracy"] * 100.0).round(2)
-    nice_table["avg_latency_ms"] = (nice_table["avg_latency_s"] * 1000.0).round(2)
-    nice_table = nice_table[
-        [
-            "uid",
-            "hotkey",
-            "queries",
-            "accuracy_pct",
-            "avg_latency_s",
-        ]
-    ].rename(
-        columns={
-            "uid": "UID",
-            "hotkey": "Hotkey",
-            "queries": "Total queries",
-            "accuracy_pct": "Accuracy (%)",
-            "avg_latency_s": "Avg latency (s)",
+    nice_table = pd.DataFrame(
+        {
+            "UID": agg_filtered["uid"],
+            "Hotkey": agg_filtered["hotkey"],
+            "Total queries": agg_filtered["queries"],
+            "Accuracy (%)": (agg_filtered["accuracy"] * 100.0).round(2),
+            "Avg latency (s)": agg_filtered["avg_latency_s"],
         }
     )
     st.dataframe(nice_table, use_container_width=True)
@@ -676,6 +843,8 @@ def page_miner_detail():
     top_row = st.columns([1, 5, 1])
     with top_row[0]:
         if st.button("Refresh miner data"):
+            get_miner_stats.clear()
+            get_miner_recent_samples.clear()
             st.rerun()
 
     mock_df_full = _mock_overview_df()
@@ -687,7 +856,7 @@ def page_miner_detail():
 
     uid = st.selectbox("Select miner UID", options=miner_list)
 
-    stats_df = get_miner_stats(uid, fallback_df=mock_df_full)
+    stats_df = get_miner_stats(uid, _fallback_df=mock_df_full)
     st.subheader("Summary stats")
 
     if stats_df.empty:
@@ -717,7 +886,7 @@ def page_miner_detail():
     st.markdown("---")
     st.subheader("Recent queries from this miner")
 
-    recent_df = get_miner_recent_samples(uid, fallback_df=mock_df_full)
+    recent_df = get_miner_recent_samples(uid, _fallback_df=mock_df_full)
     if recent_df.empty:
         st.info("No recent samples.")
     else:
@@ -726,31 +895,18 @@ def page_miner_detail():
             "Only miner predictions & timing."
         )
 
-        st.dataframe(
-            recent_df[
-                [
-                    "ts",
-                    "block",
-                    "problem_id",
-                    "accuracy",
-                    "response_time",
-                    "partial_correctness",
-                    "grid_similarity",
-                    "efficiency_score",
-                ]
-            ],
-            use_container_width=True,
-        )
+        st.dataframe(recent_df, use_container_width=True)
 
         st.subheader("Accuracy vs Latency (this miner)")
         miner_fig = px.scatter(
             recent_df,
             x="response_time",
-            y=recent_df["accuracy"].astype(int),
+            # accuracy is already 0/1 ints (both the SQL and mock paths)
+            y="accuracy",
             hover_data=["problem_id", "block", "ts"],
             labels={
                 "response_time": "Latency (s)",
-                "y": "Exact Match",
+                "accuracy": "Exact Match",
             },
             title=f"Miner {uid}: Accuracy vs Latency",
         )
@@ -763,6 +919,7 @@ def page_validators():
     top_row = st.columns([1, 5, 1])
     with top_row[0]:
         if st.button("Refresh validators"):
+            get_validator_versions.clear()
             st.rerun()
 
     df, latest_version = get_validator_versions()
@@ -771,35 +928,18 @@ def page_validators():
         st.warning("No validator heartbeat data yet.")
         return
 
-    status_labels = []
-    status_dots = []
-    last_heartbeat_strs = []
-    for _, row in df.iterrows():
-        lbl, dot = version_status_label_and_color(
-            row.get("version"), latest_version
-        )
-        status_labels.append(lbl)
-        status_dots.append(dot)
+    # Only a handful of distinct versions: classify each once, then map
+    status_by_version = {
+        v: version_status_label_and_color(v, latest_version)
+        for v in df["version"].unique()
+    }
+    df["status_label"] = df["version"].map(lambda v: status_by_version[v][0])
+    df["status_dot"] = df["version"].map(lambda v: status_by_version[v][1])
 
-        ts_val = row.get("ts")
-        if isinstance(ts_val, datetime):
-            last_heartbeat_strs.append(ts_val.strftime("%Y-%m-%d %H:%M:%S UTC"))
-        else:
-            last_heartbeat_strs.append(str(ts_val))
-
-    df["status_label"] = status_labels
-    df["status_dot"] = status_dots
-    df["last_heartbeat"] = last_heartbeat_strs
-
-    last_set_times = []
-    time_since_set = []
-    for _, row in df.iterrows():
-        hotkey = row["wallet_hotkey"]
-        info = summarize_last_set_weights_for_hotkey(hotkey, DEFAULT_ENDPOINT)
-        last_set_times.append(info["last_ts_human"])
-        time_since_set.append(info["time_since"])
-    df["last_set_weights_at"] = last_set_times
-    df["since_last_set"] = time_since_set
+    if pd.api.types.is_datetime64_any_dtype(df["ts"]):
+        df["last_heartbeat"] = df["ts"].dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+    else:
+        df["last_heartbeat"] = df["ts"].astype(str)
 
     st.subheader("Latest validator state")
     st.caption(
@@ -814,15 +954,21 @@ def page_validators():
             "version": df["version"],
             "status": df["status_dot"] + " " + df["status_label"],
             "last_heartbeat": df["last_heartbeat"],
-            "last_set_weights_at": df["last_set_weights_at"],
-            "since_last_set": df["since_last_set"],
+            "last_set_weights_at": "…",
+            "since_last_set": "…",
         }
-    )
-
-    st.dataframe(
-        table_df,
-        use_container_width=True,
-    )
+    ).reset_index(drop=True)
+
+    # Show the table straight away and fill in the chain columns as each lookup lands
+    table_placeholder = st.empty()
+    table_placeholder.dataframe(table_df, use_container_width=True)
+
+    at_col = table_df.columns.get_loc("last_set_weights_at")
+    since_col = table_df.columns.get_loc("since_last_set")
+    for i, info in iter_last_set_weights_for_hotkeys(table_df["validator"].tolist(), DEFAULT_ENDPOINT):
+        table_df.iat[i, at_col] = info["last_ts_human"]
+        table_df.iat[i, since_col] = info["time_since"]
+        table_placeholder.dataframe(table_df, use_container_width=True)
 
     st.markdown("---")
 
@@ -29,6 +29,15 @@ CREATE TABLE IF NOT EXISTS miner_metrics (
 CREATE INDEX IF NOT EXISTS idx_miner_metrics_block_uid
     ON miner_metrics (block, uid);
 
+-- Recent reads: the overview's ts window, and per-miner recent samples / stats
+-- (WHERE uid = ... ORDER BY ts DESC). On a live database build these with
+-- CREATE INDEX CONCURRENTLY instead.
+CREATE INDEX IF NOT EXISTS idx_miner_metrics_ts
+    ON miner_metrics (ts DESC);
+
+CREATE INDEX IF NOT EXISTS idx_miner_metrics_uid_ts
+    ON miner_metrics (uid, ts DESC);
+
 
 CREATE TABLE IF NOT EXISTS batch_summary (
     id SERIAL PRIMARY KEY,
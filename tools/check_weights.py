@@ -1,28 +1,35 @@
 import argparse
+from collections import OrderedDict
 from datetime import datetime, timezone
+
+import numpy as np
+from scalecodec.base import ScaleBytes
 from substrateinterface import SubstrateInterface
 
 U16_MAX = 65535
 DEFAULT_ENDPOINT = "wss://entrypoint-finney.opentensor.ai:443"
 SS58_FORMAT = 42
+_TS_FMT = "%Y-%m-%d %H:%M:%S %Z"
+
+# (endpoint, block_number) -> timestamp ms; a block's timestamp never changes
+_BLOCK_TS_CACHE: "OrderedDict[tuple[str, int], int]" = OrderedDict()
+BLOCK_TS_CACHE_SIZE = 4096
 
 
-def read_weights_by_uid(substrate: SubstrateInterface, netuid: int, uid: int):
+def parse_weights(vals) -> tuple[np.ndarray, np.ndarray]:
     """
-    Reads SubtensorModule::Weights(netuid, uid) -> Vec<(u16 dest_uid, u16 weight)>
+    SubtensorModule::Weights(netuid, uid) value -> (dest_uids, weights), two uint16 arrays
     """
-    q = substrate.query("SubtensorModule", "Weights", [netuid, uid])
-    vals = q.value or []
-    return [(int(dest), int(w)) for dest, w in vals]
+    vals = vals or []
+    uids = np.fromiter((int(dest) for dest, _ in vals), dtype=np.uint16, count=len(vals))
+    ws = np.fromiter((int(w) for _, w in vals), dtype=np.uint16, count=len(vals))
+    return uids, ws
 
 
-def get_last_update_block(substrate: SubstrateInterface, netuid: int, uid: int) -> int | None:
+def pick_last_update(arr, uid: int) -> int | None:
     """
-    Reads SubtensorModule::LastUpdate(netuid) -> Vec<BlockNumber>
-    and returns entry for 'uid' if present.
+    Entry for 'uid' in a SubtensorModule::LastUpdate(netuid) value, if present.
     """
-    q = substrate.query("SubtensorModule", "LastUpdate", [netuid], block_hash=None)
-    arr = q.value
     if not arr or uid >= len(arr):
         return None
     try:
@@ -34,23 +41,86 @@ def get_last_update_block(substrate: SubstrateInterface, netuid: int, uid: int)
             return None
 
 
-def get_block_timestamp(substrate: SubstrateInterface, block_number: int) -> int | None:
+def query_values(substrate: SubstrateInterface, storage_keys, block_hash: str | None = None) -> list:
+    """
+    Values of several storage keys from one state_queryStorageAt round trip, in input order
+    """
+    by_key = {
+        key.to_hex(): obj.value
+        for key, obj in substrate.query_multi(storage_keys, block_hash=block_hash)
+    }
+    return [by_key.get(key.to_hex()) for key in storage_keys]
+
+
+def read_chain_state(substrate: SubstrateInterface, netuid: int, uid: int) -> dict:
+    """
+    Everything main() needs from the head block: its number, plus
+    MinAllowedWeights, Weights, LastUpdate and Timestamp::Now read in one batch.
+    Each read is pinned to one head hash, so they all see the same block.
+    """
+    block_hash = substrate.get_chain_head()
+    header = substrate.get_block_header(block_hash=block_hash)
+    try:
+        current_block = int(header["header"]["number"])
+    except Exception:
+        current_block = None
+
+    now_key = substrate.create_storage_key("Timestamp", "Now")
+    min_allowed, weights, last_update, now = query_values(
+        substrate,
+        [
+            substrate.create_storage_key("SubtensorModule", "MinAllowedWeights", [netuid]),
+            substrate.create_storage_key("SubtensorModule", "Weights", [netuid, uid]),
+            substrate.create_storage_key("SubtensorModule", "LastUpdate", [netuid]),
+            now_key,
+        ],
+        block_hash=block_hash,
+    )
+    return {
+        "current_block": current_block,
+        "current_ts": int(now) if now is not None else None,
+        "min_allowed": min_allowed,
+        "weights": parse_weights(weights),
+        "last_block": pick_last_update(last_update, uid),
+        "now_key": now_key,
+    }
+
+
+def get_block_timestamp(substrate: SubstrateInterface, block_number: int, now_key=None) -> int | None:
     """
     Returns the timestamp (ms since UNIX epoch) at the given block, by:
       - block_hash = get_block_hash(block_number)
       - query Timestamp::Now at that block hash
+        (given its storage key, read raw: skips loading that block's runtime)
+    Successful lookups are memoized per endpoint.
     """
     if block_number is None:
         return None
     
+    key = (substrate.url, block_number)
+    cached = _BLOCK_TS_CACHE.get(key)
+    if cached is not None:
+        _BLOCK_TS_CACHE.move_to_end(key)
+        return cached
+    
     try:
         block_hash = substrate.get_block_hash(block_number)
         if block_hash is None:
             return None
         
-        ts_q = substrate.query("Timestamp", "Now", block_hash=block_hash)
-        ts = ts_q.value  # milliseconds
-        return int(ts) if ts is not None else None
+        if now_key is not None:
+            data = substrate.rpc_request("state_getStorage", [now_key.to_hex(), block_hash]).get("result")
+            ts = now_key.decode_scale_value(ScaleBytes(data)).value if data else None
+        else:
+            ts = substrate.query("Timestamp", "Now", block_hash=block_hash).value
+        # milliseconds
+        if ts is None:
+            return None
+        ts = int(ts)
+        _BLOCK_TS_CACHE[key] = ts
+        if len(_BLOCK_TS_CACHE) > BLOCK_TS_CACHE_SIZE:
+            _BLOCK_TS_CACHE.popitem(last=False)
+        return ts
     
     except Exception as e:
         print(f"\nWarning: Could not retrieve timestamp for block {block_number}. The block state may have been pruned.")
@@ -58,31 +128,18 @@ def get_block_timestamp(substrate: SubstrateInterface, block_number: int) -> int
         return None
 
 
-def get_current_block_and_timestamp(substrate: SubstrateInterface) -> tuple[int | None, int | None]:
-    """
-    Returns (current_block_number, current_timestamp_ms)
-    """
-    # current block number
-    header = substrate.get_block_header()
-    try:
-        current_block = int(header["header"]["number"])
-    except Exception:
-        current_block = None
-
-    # current timestamp (no block_hash => latest)
-    ts_q = substrate.query("Timestamp", "Now")
-    current_ts = int(ts_q.value) if ts_q and ts_q.value is not None else None
-
-    return current_block, current_ts
-
-
 def fmt_ts(ts_ms: int | None) -> str:
     if ts_ms is None:
         return "unknown"
     dt = datetime.fromtimestamp(ts_ms / 1000.0, tz=timezone.utc)
-    # Show both UTC and local (system) time for convenience
+    utc_str = dt.strftime(_TS_FMT)
+    # Show both UTC and local (system) time for convenience.
+    # astimezone() with no argument looks the zone up per timestamp, so DST is right.
     local_dt = dt.astimezone()  # convert to local tz of the machine running the script
-    return f"{dt.strftime('%Y-%m-%d %H:%M:%S %Z')} / {local_dt.strftime('%Y-%m-%d %H:%M:%S %Z')}"
+    if local_dt.tzname() == "UTC":
+        # Servers and containers usually run in UTC: both halves are the same string
+        return f"{utc_str} / {utc_str}"
+    return f"{utc_str} / {local_dt.strftime(_TS_FMT)}"
 
 
 def human_delta(ms_then: int | None, ms_now: int | None) -> str:
@@ -111,53 +168,56 @@ def main():
     print(f"Connecting to: {args.endpoint}")
     substrate = SubstrateInterface(url=args.endpoint, ss58_format=SS58_FORMAT, use_remote_preset=True)
 
-    current_block, current_ts = get_current_block_and_timestamp(substrate)
-
+    state = read_chain_state(substrate, args.netuid, args.uid)
+    current_block, current_ts = state["current_block"], state["current_ts"]
 
     print(f"NetUID: {args.netuid}  |  Validator UID: {args.uid}")
-    min_allowed = substrate.query("SubtensorModule", "MinAllowedWeights", [args.netuid])
-    print(f"Minimum allowed weight %: {min_allowed.value / U16_MAX * 100:.2f}%")
-    print(f"min_allowed.value: {min_allowed.value}")
+    min_allowed = state["min_allowed"]
+    print(f"Minimum allowed weight %: {min_allowed / U16_MAX * 100:.2f}%")
+    print(f"min_allowed.value: {min_allowed}")
 
     if current_block is not None:
         print(f"Current block: {current_block}")
     if current_ts is not None:
         print(f"Current time (UTC / local): {fmt_ts(current_ts)}")
 
-    weights = read_weights_by_uid(substrate, args.netuid, args.uid)
-    if not weights:
+    uids, ws = state["weights"]
+    if not len(ws):
         print("\nNo weights set.")
     else:
-        total = sum(w for _, w in weights)
-        weights_sorted = sorted(weights, key=lambda x: x[1], reverse=True)
+        total = int(ws.sum(dtype=np.uint64))
+        # Heaviest first; stable, so equal weights keep their on-chain order
+        order = np.argsort(-ws.astype(np.int32), kind="stable")
 
-        print(f"\nEntries: {len(weights_sorted)}")
+        print(f"\nEntries: {len(ws)}")
         print(f"Raw sum (uint16 ticks): {total} (target ≈ {U16_MAX})\n")
 
-        top_n = weights_sorted[:args.top]
-        print(f"Top {len(top_n)} destinations:")
+        top = order[:args.top]
+        top_ws = ws[top]
+        shares = top_ws / total if total > 0 else np.zeros(len(top))
+        print(f"Top {len(top)} destinations:")
         print(f"{'UID':>6}  {'Ticks':>8}  {'Share (sum=1)':>14}  {'Percent':>9}")
         print("-" * 44)
-        for dest_uid, w in top_n:
-            share = (w / total) if total > 0 else 0.0
+        # Only the printed rows go through Python
+        for dest_uid, w, share in zip(uids[top].tolist(), top_ws.tolist(), shares.tolist()):
             print(f"{dest_uid:>6}  {w:>8}  {share:>14.8f}  {share*100:>8.4f}%")
 
-        if len(weights_sorted) > len(top_n):
-            tail_sum = sum(w for _, w in weights_sorted[args.top:])
+        if len(ws) > len(top):
+            tail_sum = total - int(top_ws.sum(dtype=np.uint64))
             tail_share = tail_sum / total if total > 0 else 0.0
             print("-" * 44)
             print(f"{'...':>6}  {tail_sum:>8}  {tail_share:>14.8f}  {tail_share*100:>8.4f}%")
 
-        if len(weights_sorted) == 1 and weights_sorted[0][1] == U16_MAX:
-            only_uid = weights_sorted[0][0]
+        if len(ws) == 1 and ws[0] == U16_MAX:
+            only_uid = int(uids[0])
             print("\nℹ️  Only one weight at 65535 ticks (all to UID {}).".format(only_uid))
 
-    last_block = get_last_update_block(substrate, args.netuid, args.uid)
+    last_block = state["last_block"]
     if last_block is None:
         print("\nLast set_weights block: unknown (no entry in LastUpdate).")
         return
 
-    last_ts = get_block_timestamp(substrate, last_block)
+    last_ts = get_block_timestamp(substrate, last_block, state["now_key"])
     print(f"\nLast set_weights block: {last_block}")
     print(f"Last set_weights time (UTC / local): {fmt_ts(last_ts)}")
 
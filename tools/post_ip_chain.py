@@ -1,23 +1,38 @@
 import argparse
+import atexit
+import ipaddress
 import json
+import os
 import sys
 import socket
+import threading
+from functools import lru_cache
 from pathlib import Path
 from substrateinterface import SubstrateInterface, Keypair
 
-import netaddr
+
+@lru_cache(maxsize=8)
+def _wallet_dir(wallet_path: str, wallet_name: str) -> Path:
+    return Path(wallet_path).expanduser() / wallet_name
+
+
+@lru_cache(maxsize=32)
+def _read_hotkey_json(path: str, mtime_ns: int) -> dict:
+    """Parsed hotkey file; keyed on mtime so an edited file is read again."""
+    with open(path, "r") as f:
+        return json.load(f)
 
 
 def load_keypair(wallet_name: str, hotkey: str, wallet_path: str = "~/.bittensor/wallets") -> Keypair:
     """Load keypair from Bittensor wallet files."""
-    base_path = Path(wallet_path).expanduser()
-    hotkey_file = base_path / wallet_name / "hotkeys" / hotkey
+    hotkey_file = _wallet_dir(wallet_path, wallet_name) / "hotkeys" / hotkey
     
-    if not hotkey_file.exists():
-        raise FileNotFoundError(f"Hotkey file not found: {hotkey_file}")
+    try:
+        mtime_ns = os.stat(hotkey_file).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Hotkey file not found: {hotkey_file}") from None
     
-    with open(hotkey_file, "r") as f:
-        keypair_data = json.load(f)
+    keypair_data = _read_hotkey_json(str(hotkey_file), mtime_ns)
     
     if "secretSeed" in keypair_data:
         return Keypair.create_from_seed(keypair_data["secretSeed"])
@@ -29,18 +44,21 @@ def load_keypair(wallet_name: str, hotkey: str, wallet_path: str = "~/.bittensor
 
 def load_coldkey_address(wallet_name: str, wallet_path: str = "~/.bittensor/wallets") -> str:
     """Load coldkey address from wallet."""
-    base_path = Path(wallet_path).expanduser()
-    coldkey_file = base_path / wallet_name / "coldkeypub.txt"
+    wallet_dir = _wallet_dir(wallet_path, wallet_name)
     
-    if coldkey_file.exists():
-        with open(coldkey_file, "r") as f:
+    # Open directly rather than exists() then open: one filesystem call per candidate
+    try:
+        with open(wallet_dir / "coldkeypub.txt", "r") as f:
             return f.read().strip()
+    except FileNotFoundError:
+        pass
     
-    coldkey_file = base_path / wallet_name / "coldkey"
-    if coldkey_file.exists():
-        with open(coldkey_file, "r") as f:
+    try:
+        with open(wallet_dir / "coldkey", "r") as f:
             data = json.load(f)
             return data.get("ss58Address", "")
+    except FileNotFoundError:
+        pass
     
     print(f"Warning: Could not find coldkey for wallet {wallet_name}, using hotkey address")
     return ""
@@ -48,19 +66,11 @@ def load_coldkey_address(wallet_name: str, wallet_path: str = "~/.bittensor/wall
 
 def resolve_hostname_to_ip(hostname: str) -> str:
     """Resolve a hostname to an IP address."""
-    if netaddr:
-        try:
-            netaddr.IPAddress(hostname)
-            return hostname
-        except netaddr.AddrFormatError:
-            pass
-    else:
-        try:
-            parts = hostname.split('.')
-            if len(parts) == 4 and all(p.isdigit() and 0 <= int(p) <= 255 for p in parts):
-                return hostname
-        except:
-            pass
+    try:
+        ipaddress.ip_address(hostname)
+        return hostname
+    except ValueError:
+        pass
     
     try:
         ip_address = socket.gethostbyname(hostname)
@@ -72,29 +82,49 @@ def resolve_hostname_to_ip(hostname: str) -> str:
 
 def ip_to_int(ip_str: str) -> int:
     """Convert IP address to integer."""
-    if netaddr:
-        return int(netaddr.IPAddress(ip_str))
-    else:
-        parts = ip_str.split('.')
-        if len(parts) != 4:
-            raise ValueError("Invalid IP format")
-        
-        for part in parts:
-            if not 0 <= int(part) <= 255:
-                raise ValueError("IP octet out of range")
-        
-        return int(''.join([f"{int(x):02x}" for x in parts]), 16)
+    return int(ipaddress.ip_address(ip_str))
 
 
 def ip_version(ip_str: str) -> int:
     """Get IP version (4 for IPv4, 6 for IPv6)."""
-    if netaddr:
-        return int(netaddr.IPAddress(ip_str).version)
-    else:
-        if ':' in ip_str:
-            return 6
-        else:
-            return 4
+    return ipaddress.ip_address(ip_str).version
+
+
+# One connection per endpoint for the life of the process, so repeated
+# set_miner_ip calls (e.g. from a wrapper script) skip the handshake and
+# metadata download. Closed at exit.
+_substrates: dict[str, SubstrateInterface] = {}
+_substrates_lock = threading.Lock()
+
+
+def get_substrate(chain_endpoint: str) -> SubstrateInterface:
+    """Shared connection to chain_endpoint, opened on first use."""
+    with _substrates_lock:
+        substrate = _substrates.get(chain_endpoint)
+        if substrate is None:
+            substrate = SubstrateInterface(url=chain_endpoint, auto_reconnect=True)
+            _substrates[chain_endpoint] = substrate
+        return substrate
+
+
+def _discard_substrate(chain_endpoint: str):
+    """Close and forget a connection that failed, so the next call reconnects."""
+    with _substrates_lock:
+        substrate = _substrates.pop(chain_endpoint, None)
+    if substrate is not None:
+        substrate.close()
+
+
+@atexit.register
+def _close_substrates():
+    with _substrates_lock:
+        substrates = list(_substrates.values())
+        _substrates.clear()
+    for substrate in substrates:
+        try:
+            substrate.close()
+        except Exception:
+            pass
 
 
 def set_miner_ip(
@@ -127,8 +157,9 @@ def set_miner_ip(
     print(f"Resolving IP {ip}...")
     try:
         resolved_ip = resolve_hostname_to_ip(ip)
-        ip_int = ip_to_int(resolved_ip)
-        ip_ver = ip_version(resolved_ip)
+        address = ipaddress.ip_address(resolved_ip)
+        ip_int = int(address)
+        ip_ver = address.version
         print(f"✓ IP resolved: {ip} -> {resolved_ip} (IPv{ip_ver}, int: {ip_int})")
     except Exception as e:
         print(f"✗ Failed to process IP: {e}")
@@ -136,7 +167,7 @@ def set_miner_ip(
     
     print(f"Connecting to chain at {chain_endpoint}...")
     try:
-        substrate = SubstrateInterface(url=chain_endpoint)
+        substrate = get_substrate(chain_endpoint)
         print(f"✓ Connected to chain")
     except Exception as e:
         print(f"✗ Failed to connect to chain: {e}")
@@ -173,7 +204,6 @@ def set_miner_ip(
         print(f"✓ Transaction created")
     except Exception as e:
         print(f"✗ Failed to create transaction: {e}")
-        substrate.close()
         return False
     
     print(f"Submitting transaction to chain...")
@@ -202,9 +232,8 @@ def set_miner_ip(
             
     except Exception as e:
         print(f"✗ Failed to submit transaction: {e}")
+        _discard_substrate(chain_endpoint)
         return False
-    finally:
-        substrate.close()
 
 
 def main():
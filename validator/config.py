@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Callable, Optional
 
 from common.constants import (
@@ -8,7 +9,6 @@ from common.constants import (
     NETUID_MAINNET,
 )
 
-import bittensor as bt
 
 def resolve_hotkey(
     wallet_name: str | None, 
@@ -22,6 +22,9 @@ def resolve_hotkey(
         return None
 
     try:
+        # bittensor is slow to import; only pay for it when a wallet is loaded
+        import bittensor as bt
+
         expanded_path = os.path.expanduser(wallet_path) if wallet_path else None
         
         wallet = bt.wallet(
@@ -45,7 +48,8 @@ class ValidatorConfig:
     wallet_hotkey: Optional[str] = os.getenv("WALLET_HOTKEY")
     wallet_path: Optional[str] = os.getenv("WALLET_PATH", "~/.bittensor/wallets")
 
-    hotkey: Optional[str] = resolve_hotkey(wallet_name=wallet_name, wallet_hotkey=wallet_hotkey, wallet_path=wallet_path)
+    # Resolved from the wallet in __post_init__ unless given
+    hotkey: Optional[str] = None
 
     default_miner_port: int = int(os.getenv("MINER_PORT", "8091"))
 
@@ -63,22 +67,30 @@ class ValidatorConfig:
     retention_days: int = int(os.getenv("RETENTION_DAYS", "30"))
     cleanup_interval_hours: int = int(os.getenv("CLEANUP_INTERVAL_HOURS", "24"))
     
+    def __post_init__(self):
+        if self.hotkey is None:
+            self.hotkey = resolve_hotkey(
+                wallet_name=self.wallet_name,
+                wallet_hotkey=self.wallet_hotkey,
+                wallet_path=self.wallet_path,
+            )
+    
     @property
     def cycle_duration(self) -> int:
         """Duration of each query cycle in blocks"""
         return self._cycle_duration
     
-    @property
+    @cached_property
     def query_interval_blocks(self) -> int:
         """Minimum blocks between query cycles"""
         return self.cycle_duration + 5
     
-    @property
+    @cached_property
     def weights_interval_blocks(self) -> int:
         """Minimum blocks between weight settings"""
         return self.cycle_duration + 5
     
-    @property
+    @cached_property
     def score_window_blocks(self) -> int:
         """Look back window for scoring (e.g., last 4 cycles)"""
         return self.cycle_duration * 4
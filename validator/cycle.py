@@ -1,26 +1,101 @@
 import asyncio
-import hashlib
+import xxhash
 from loguru import logger
 from validator import discovery, query, scoring
-import random
+import numpy as np
 from datetime import datetime, timezone
 
-async def run_query_cycle(validator, state):
-    """Run continuous queries for CYCLE_DURATION blocks"""
+def _read_version() -> str:
     try:
         with open("validator/.version", "r") as f:
-            validator_version = f.read().strip()
+            return f.read().strip()
     except Exception as e:
         logger.warning(f"Could not read .version file: {e}")
-        validator_version = "unknown"
+        return "unknown"
+
+_rng = np.random.default_rng()
+
+# Read once: an update replaces the container, so it can't change under a running process
+VALIDATOR_VERSION = _read_version()
+
+def _problem_id(problem_set) -> str:
+    """
+    16 hex char dedup key over the test input and transformation chain.
+    Not a security boundary, so a fast 64-bit hash; the grid is fed in
+    row by row (cells are colors 0-9, so 0xff can't be mistaken for one)
+    rather than through its repr.
+    """
+    h = xxhash.xxh3_64()
+    for row in problem_set['test_input']:
+        h.update(bytes(row))
+        h.update(b"\xff")
+    h.update(repr(problem_set['metadata']['transformation_chain']).encode())
+    return h.hexdigest()
+
+def _generate_problem(validator, num_train: int, chain_length: int):
+    """Generate one problem for a query round; None if the generated set is unusable"""
+    problem_set = validator.synthetic_generator.generate_problem_set(
+        num_train=num_train,
+        num_test=1,
+        chain_length=chain_length,
+    )
+    
+    actual_train_count = len(problem_set.get('train_examples', []))
+    if actual_train_count == 0:
+        logger.warning(f"Generated problem set has no training examples (requested {num_train}), skipping")
+        return None
+    
+    if not problem_set.get('test_input') or not problem_set.get('test_output'):
+        logger.warning(f"Generated problem set missing test input/output, skipping")
+        return None
+    
+    problem_id = _problem_id(problem_set)
+    
+    chain_length_actual = len(problem_set['metadata']['transformation_chain'])
+    logger.info(f'Generated problem {problem_id} '
+               f'train_examples={actual_train_count} | chain_length={chain_length_actual}')
+    
+    return {
+        'id': problem_id,
+        'problem_set': problem_set,
+        'num_train_examples': actual_train_count,
+        # Miners get the lists as JSON; scoring compares against this copy
+        'test_output_grid': np.asarray(problem_set['test_output'], dtype=np.int8),
+        'metadata': {
+            'base_task_num': problem_set['metadata']['base_task'],
+            'chain_length': problem_set['metadata']['chain_length'],
+            'transformation_chain': problem_set['metadata']['transformation_chain']
+        }
+    }
+
+# A query round starts once the chain is past the previous round's block,
+# polled every BLOCK_POLL_INTERVAL_S, or after ROUND_MAX_WAIT_S regardless
+BLOCK_POLL_INTERVAL_S = 3.0
+ROUND_MAX_WAIT_S = 15.0
 
+async def _wait_for_new_block(validator, block: int) -> int:
+    """Wait for a block after `block` (up to ROUND_MAX_WAIT_S); returns the latest block seen"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + ROUND_MAX_WAIT_S
+    while True:
+        # Checked before sleeping too: the round may already have outlasted the block
+        latest = validator.get_current_block()
+        if latest > block:
+            return latest
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return block
+        await asyncio.sleep(min(BLOCK_POLL_INTERVAL_S, remaining))
+
+async def run_query_cycle(validator, state):
+    """Run continuous queries for CYCLE_DURATION blocks"""
     try:
         logger.info(f"publishing validator version")
         validator.telemetry_client.publish(
             "/validator/heartbeat",
             {
                 "ts": datetime.now(timezone.utc).isoformat(),
-                "version": validator_version,
+                "version": VALIDATOR_VERSION,
                 "cycle_count": validator.state.get("cycle_count"),
                 "wallet_hotkey": validator.config.hotkey
             },
@@ -36,74 +111,48 @@ async def run_query_cycle(validator, state):
     logger.info(f"Starting query cycle at block {current_block}")
     cycle_start_block = current_block
     
-    miners = await discovery.discover_miners(validator.chain)
-    for uid, miner_node in miners.items():
-        await validator.db.upsert_miner(
-            uid=uid,
-            hotkey=miner_node.get('hotkey'),
-            ip=miner_node.get('ip'),
-            port=miner_node.get('port'),
-            stake=miner_node.get('stake'),
-            last_update_block=current_block
-        )
+    miners = discovery.freeze_miners(
+        await discovery.discover_miners(validator.chain),
+        validator.config.default_miner_port,
+    )
+    await validator.db.upsert_miners([
+        (miner.uid, miner.hotkey, miner.ip, miner.port, miner.stake, current_block)
+        for miner in miners.values()
+    ])
     
     if miners:
         logger.info(f"Persisted {len(miners)} miners to database")
     
     queries_in_cycle = 0
     while True:
-        current_block = validator.get_current_block()
-        
         if (current_block - cycle_start_block) >= validator.config.cycle_duration:
             logger.info(f"Query cycle complete after {queries_in_cycle} query rounds")
             break
         
-        problems_batch = []
         num_problems = min(5, len(miners)) or 1
+        # Sizes for the whole round in one draw each
+        num_trains = _rng.integers(
+            validator.config.min_train_examples,
+            validator.config.max_train_examples + 1,
+            size=num_problems,
+        ).tolist()
+        chain_lengths = _rng.integers(3, 6, size=num_problems).tolist()
         
-        for i in range(num_problems):
-            try:                
-                num_train = random.randint(
-                    validator.config.min_train_examples, 
-                    validator.config.max_train_examples
-                )
-                
-                chain_length = random.randint(3, 5)
-                
-                problem_set = validator.synthetic_generator.generate_problem_set(
-                    num_train=num_train,
-                    num_test=1,
-                    chain_length=chain_length,
-                )
-                
-                actual_train_count = len(problem_set.get('train_examples', []))
-                if actual_train_count == 0:
-                    logger.warning(f"Generated problem set has no training examples (requested {num_train}), skipping")
-                    continue
-                
-                if not problem_set.get('test_input') or not problem_set.get('test_output'):
-                    logger.warning(f"Generated problem set missing test input/output, skipping")
-                    continue
-                
-                problem_str = str(problem_set['test_input']) + str(problem_set['metadata']['transformation_chain'])
-                problem_id = hashlib.sha256(problem_str.encode()).hexdigest()[:16]
-                
-                problems_batch.append({
-                    'id': problem_id,
-                    'problem_set': problem_set,
-                    'num_train_examples': actual_train_count,
-                    'metadata': {
-                        'base_task_num': problem_set['metadata']['base_task'],
-                        'chain_length': problem_set['metadata']['chain_length'],
-                        'transformation_chain': problem_set['metadata']['transformation_chain']
-                    }
-                })
-                
-                chain_length_actual = len(problem_set['metadata']['transformation_chain'])
-                logger.info(f'Generated problem {problem_id} '
-                           f'train_examples={actual_train_count} | chain_length={chain_length_actual}')
-            except Exception as e:
-                logger.error(f"Failed to generate problem: {e}")
+        # Generation is CPU-bound and occasionally very slow: run it off the
+        # event loop, all of the round's problems at once
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(_generate_problem, validator, num_train, chain_length)
+                for num_train, chain_length in zip(num_trains, chain_lengths)
+            ),
+            return_exceptions=True,
+        )
+        problems_batch = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to generate problem: {result}")
+            elif result is not None:
+                problems_batch.append(result)
         
         if problems_batch:
             await query.query_miners_with_problems(
@@ -113,7 +162,8 @@ async def run_query_cycle(validator, state):
                 miners, 
                 problems_batch,
                 current_block,
-                validator.telemetry_client
+                validator.telemetry_client,
+                session=validator.http
             )
             queries_in_cycle += 1
             await validator.maybe_cleanup_database()
@@ -121,7 +171,7 @@ async def run_query_cycle(validator, state):
         else:
             logger.warning("No valid problems generated in this round, will retry")
         
-        await asyncio.sleep(15)
+        current_block = await _wait_for_new_block(validator, current_block)
     
     state['last_query_block'] = cycle_start_block
     state['cycle_count'] += 1
@@ -143,6 +193,16 @@ async def run_weights_cycle(validator, state):
     
     state['last_weights_block'] = current_block
 
+async def _interruptible_sleep(seconds: float, stop_event: asyncio.Event = None):
+    """Sleep for seconds, returning early once stop_event is set"""
+    if stop_event is None:
+        await asyncio.sleep(seconds)
+        return
+    try:
+        await asyncio.wait_for(stop_event.wait(), timeout=seconds)
+    except asyncio.TimeoutError:
+        pass
+
 async def run_continuous(validator, stop_event: asyncio.Event = None):
     """Main loop that runs cycles continuously"""
 
@@ -158,8 +218,8 @@ async def run_continuous(validator, stop_event: asyncio.Event = None):
             
             logger.info(f"Completed cycle {validator.state['cycle_count']}, waiting before next cycle...")
             
-            await asyncio.sleep(5)
+            await _interruptible_sleep(5, stop_event)
             
         except Exception as e:
             logger.error(f"Error in cycle: {e}")
-            await asyncio.sleep(5)
\ No newline at end of file
+            await _interruptible_sleep(5, stop_event)
\ No newline at end of file
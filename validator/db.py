@@ -4,7 +4,37 @@ import asyncpg
 from typing import Dict, List, Optional
 from datetime import datetime, timezone
 from loguru import logger
-import json
+import orjson
+
+
+UPSERT_MINER_SQL = """
+    INSERT INTO miners (uid, hotkey, ip, port, stake, last_update_block, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $6, NOW())
+    ON CONFLICT (uid) DO UPDATE SET
+        hotkey = EXCLUDED.hotkey,
+        ip = EXCLUDED.ip,
+        port = EXCLUDED.port,
+        stake = EXCLUDED.stake,
+        last_update_block = EXCLUDED.last_update_block,
+        updated_at = NOW()
+"""
+
+INSERT_QUERY_RESULT_SQL = """
+    INSERT INTO query_results (
+        block, uid, success, response, error, response_time, timestamp,
+        exact_match, partial_correctness, grid_similarity, efficiency_score,
+        problem_id, base_task_num, chain_length, transformation_chain, num_train_examples
+    )
+    VALUES ($1, $2, $3, $4::jsonb, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15::jsonb, $16)
+"""
+
+INSERT_SCORE_SQL = """
+    INSERT INTO scores (
+        uid, score, exact_match_rate, partial_correctness_avg, 
+        efficiency_avg, timestamp
+    ) 
+    VALUES ($1, $2, $3, $4, $5, $6)
+"""
 
 
 class Database:
@@ -40,20 +70,22 @@ class Database:
     async def upsert_miner(self, uid: int, hotkey: str, ip: Optional[str], port: Optional[int], stake: Optional[float], last_update_block: Optional[int]):
         async with self.pool.acquire() as conn:
             await conn.execute(
-                """
-                INSERT INTO miners (uid, hotkey, ip, port, stake, last_update_block, updated_at)
-                VALUES ($1, $2, $3, $4, $5, $6, NOW())
-                ON CONFLICT (uid) DO UPDATE SET
-                    hotkey = EXCLUDED.hotkey,
-                    ip = EXCLUDED.ip,
-                    port = EXCLUDED.port,
-                    stake = EXCLUDED.stake,
-                    last_update_block = EXCLUDED.last_update_block,
-                    updated_at = NOW()
-                """,
+                UPSERT_MINER_SQL,
                 uid, hotkey, ip, port, stake, last_update_block
             )
 
+    async def upsert_miners(self, rows: List[tuple]):
+        """
+        Upsert many miners in one transaction.
+        rows: (uid, hotkey, ip, port, stake, last_update_block) tuples
+        """
+        if not rows:
+            return
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                # executemany pipelines the rows rather than waiting on each one
+                await conn.executemany(UPSERT_MINER_SQL, rows)
+
     async def get_miners(self) -> List[asyncpg.Record]:
         async with self.pool.acquire() as conn:
             return await conn.fetch("SELECT * FROM miners ORDER BY uid ASC")
@@ -77,23 +109,33 @@ class Database:
         transformation_chain: Optional[List[Dict]] = None,
         num_train_examples: Optional[int] = None
     ):
-        async with self.pool.acquire() as conn:
-            response_json = json.dumps(response) if response else None
-            chain_json = json.dumps(transformation_chain) if transformation_chain else None
-            
-            await conn.execute(
-                """
-                INSERT INTO query_results (
-                    block, uid, success, response, error, response_time, timestamp,
-                    exact_match, partial_correctness, grid_similarity, efficiency_score,
-                    problem_id, base_task_num, chain_length, transformation_chain, num_train_examples
-                )
-                VALUES ($1, $2, $3, $4::jsonb, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15::jsonb, $16)
-                """,
-                block, uid, success, response_json, error, response_time, ts,
-                exact_match, partial_correctness, grid_similarity, efficiency_score,
-                problem_id, base_task_num, chain_length, chain_json, num_train_examples
+        await self.record_query_results([(
+            block, uid, success, response, error, response_time, ts,
+            exact_match, partial_correctness, grid_similarity, efficiency_score,
+            problem_id, base_task_num, chain_length, transformation_chain, num_train_examples
+        )])
+
+    async def record_query_results(self, rows: List[tuple]):
+        """
+        Insert many query results in one transaction.
+        rows: tuples of record_query_result's arguments, in order
+        """
+        if not rows:
+            return
+        # response (3) and transformation_chain (14) go in as jsonb text
+        rows = [
+            (
+                *row[:3],
+                orjson.dumps(row[3]).decode() if row[3] else None,
+                *row[4:14],
+                orjson.dumps(row[14]).decode() if row[14] else None,
+                row[15],
             )
+            for row in rows
+        ]
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(INSERT_QUERY_RESULT_SQL, rows)
 
     async def get_recent_results(self, window_blocks: int, current_block: int) -> List[asyncpg.Record]:
         min_block = max(0, current_block - window_blocks)
@@ -107,29 +149,54 @@ class Database:
                 min_block
             )
 
+    async def get_recent_stats(self, window_blocks: int, current_block: int) -> List[asyncpg.Record]:
+        """
+        Per-miner totals over the window, one row per uid: count, successful_responses,
+        and exact_matches / partial_sum / similarity_sum / efficiency_sum over the
+        successful responses
+        """
+        min_block = max(0, current_block - window_blocks)
+        async with self.pool.acquire() as conn:
+            return await conn.fetch(
+                """
+                SELECT
+                    uid,
+                    COUNT(*) AS count,
+                    COUNT(*) FILTER (WHERE success) AS successful_responses,
+                    COUNT(*) FILTER (WHERE success AND exact_match) AS exact_matches,
+                    COALESCE(SUM(partial_correctness::float8) FILTER (WHERE success), 0) AS partial_sum,
+                    COALESCE(SUM(grid_similarity::float8) FILTER (WHERE success), 0) AS similarity_sum,
+                    COALESCE(SUM(efficiency_score::float8) FILTER (WHERE success), 0) AS efficiency_sum
+                FROM query_results
+                WHERE block >= $1
+                GROUP BY uid
+                ORDER BY uid
+                """,
+                min_block
+            )
+
     async def save_scores(self, scores: Dict[int, Dict[str, float]]):
         """
         Save scores with detailed metrics.
         scores format: {uid: {"score": float, "exact_match_rate": float, ...}}
         """
         ts = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows = [
+            (
+                uid, 
+                float(metrics.get("score", 0.0)),
+                float(metrics.get("exact_match_rate", 0.0)),
+                float(metrics.get("partial_correctness_avg", 0.0)),
+                float(metrics.get("efficiency_avg", 0.0)),
+                ts
+            )
+            for uid, metrics in scores.items()
+        ]
+        if not rows:
+            return
         async with self.pool.acquire() as conn:
-            for uid, metrics in scores.items():
-                await conn.execute(
-                    """
-                    INSERT INTO scores (
-                        uid, score, exact_match_rate, partial_correctness_avg, 
-                        efficiency_avg, timestamp
-                    ) 
-                    VALUES ($1, $2, $3, $4, $5, $6)
-                    """,
-                    uid, 
-                    float(metrics.get("score", 0.0)),
-                    float(metrics.get("exact_match_rate", 0.0)),
-                    float(metrics.get("partial_correctness_avg", 0.0)),
-                    float(metrics.get("efficiency_avg", 0.0)),
-                    ts
-                )
+            async with conn.transaction():
+                await conn.executemany(INSERT_SCORE_SQL, rows)
 
     async def get_scores_last_hours(self, hours: int = 24) -> List[asyncpg.Record]:
         async with self.pool.acquire() as conn:
@@ -1,6 +1,20 @@
-from typing import Dict
+from dataclasses import dataclass
+from typing import Dict, Optional
 from loguru import logger
 
+
+@dataclass(frozen=True, slots=True)
+class MinerInfo:
+    """The fields of a discovered miner that a cycle uses, read once from the chain dict"""
+    uid: int
+    hotkey: Optional[str]
+    ip: Optional[str]
+    port: Optional[int]
+    stake: Optional[float]
+    # http://ip:port, with the default miner port when the chain has none
+    base_url: str
+
+
 async def discover_miners(chain) -> Dict[int, Dict]:
     try:
         chain.connect()
@@ -9,4 +23,21 @@ async def discover_miners(chain) -> Dict[int, Dict]:
         return miners
     except Exception as e:
         logger.error(f"Chain discovery failed: {e}")
-        return {}
\ No newline at end of file
+        return {}
+
+
+def freeze_miners(miners: Dict[int, Dict], default_port: int) -> Dict[int, MinerInfo]:
+    """uid -> MinerInfo for the discovered miners, built once per cycle"""
+    frozen = {}
+    for uid, node in miners.items():
+        ip = node.get("ip")
+        port = node.get("port")
+        frozen[uid] = MinerInfo(
+            uid=uid,
+            hotkey=node.get("hotkey"),
+            ip=ip,
+            port=port,
+            stake=node.get("stake"),
+            base_url=f"http://{ip}:{port or default_port}",
+        )
+    return frozen
@@ -4,11 +4,31 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timezone
 from loguru import logger
 import json
+import operator
+import orjson
+import numpy as np
+from contextlib import nullcontext
 
 from common.epistula import Epistula
 from common.constants import QUERY_ENDPOINT, CHECK_TASK_ENDPOINT, MAX_POLL_ATTEMPTS, POLL_INTERVAL 
+from validator.discovery import MinerInfo
 from validator.telemetry import TelemetryClient
 
+# Same cap on open sockets as aiohttp's default, but idle connections are
+# kept past the ~10s gaps between polls and rounds
+HTTP_POOL_LIMIT = 100
+HTTP_KEEPALIVE_S = 60
+
+# Query results buffered before a bulk insert
+RESULTS_FLUSH_ROWS = 256
+
+def create_session() -> aiohttp.ClientSession:
+    """HTTP session for querying miners; create it inside the running loop and reuse it"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=HTTP_POOL_LIMIT, keepalive_timeout=HTTP_KEEPALIVE_S),
+        timeout=aiohttp.ClientTimeout(total=60),
+    )
+
 def calculate_grid_similarity(grid1: List[List[int]], grid2: List[List[int]]) -> float:
     """Calculate pixel-wise similarity between two grids"""
     if not grid1 or not grid2:
@@ -22,11 +42,19 @@ def calculate_grid_similarity(grid1: List[List[int]], grid2: List[List[int]]) ->
     if total_cells == 0:
         return 0.0
     
-    matching_cells = sum(
-        1 for i in range(len(grid1))
-        for j in range(len(grid1[0]))
-        if grid1[i][j] == grid2[i][j]
-    )
+    width = len(grid1[0])
+    if all(len(row) == width for row in grid1) and all(len(row) == width for row in grid2):
+        # rectangular: count per row in C, skipping rows that match outright
+        matching_cells = sum(
+            width if row1 == row2 else sum(map(operator.eq, row1, row2))
+            for row1, row2 in zip(grid1, grid2)
+        )
+    else:
+        matching_cells = sum(
+            1 for i in range(len(grid1))
+            for j in range(len(grid1[0]))
+            if grid1[i][j] == grid2[i][j]
+        )
     
     return matching_cells / total_cells
 
@@ -66,6 +94,60 @@ def calculate_partial_correctness(predicted: List[List[int]], expected: List[Lis
     
     return min(1.0, score)
 
+def _int_grid(grid) -> Optional[np.ndarray]:
+    """grid as a non-empty 2-D integer array; None if it is ragged, empty or not all ints"""
+    try:
+        arr = np.asarray(grid)
+    except (ValueError, TypeError):
+        return None
+    if arr.ndim != 2 or arr.size == 0 or arr.dtype.kind not in "biu":
+        return None
+    return arr
+
+def _colors(grid: np.ndarray) -> Optional[np.ndarray]:
+    """Which of the values 0-255 appear in grid, or None if it has any outside that range"""
+    if grid.min() < 0 or grid.max() > 255:
+        return None
+    return np.bincount(grid.ravel(), minlength=256) > 0
+
+def score_prediction(predicted, expected: List[List[int]], expected_grid: np.ndarray) -> Tuple[bool, float, float]:
+    """
+    (exact match, partial correctness, grid similarity) of predicted against
+    expected, as ==, calculate_partial_correctness and calculate_grid_similarity
+    give them. expected_grid is expected as int8; a well-formed prediction is
+    scored on arrays in one pass, anything else goes through the list functions.
+    """
+    exact_match = predicted == expected
+    if exact_match and expected_grid.size:
+        # identical grids score full marks on every measure
+        return True, 1.0, 1.0
+    
+    pred = _int_grid(predicted)
+    if pred is None or expected_grid.size == 0:
+        return (
+            exact_match,
+            calculate_partial_correctness(predicted, expected),
+            calculate_grid_similarity(predicted, expected),
+        )
+    
+    shape_match = pred.shape == expected_grid.shape
+    similarity = np.count_nonzero(pred == expected_grid) / expected_grid.size if shape_match else 0.0
+    
+    # same weights and order of additions as calculate_partial_correctness
+    score = 0.0
+    score += 0.3 if shape_match else 0
+    if shape_match:
+        score += 0.5 * similarity
+    pred_colors, exp_colors = _colors(pred), _colors(expected_grid)
+    if pred_colors is not None and exp_colors is not None:
+        color_overlap = np.count_nonzero(pred_colors & exp_colors) / np.count_nonzero(exp_colors)
+    else:
+        exp_values = np.unique(expected_grid)
+        color_overlap = np.intersect1d(np.unique(pred), exp_values, assume_unique=True).size / exp_values.size
+    score += 0.2 * color_overlap
+    
+    return exact_match, float(min(1.0, score)), float(similarity)
+
 def calculate_efficiency_score(response_time: float, max_time: float = 30.0) -> float:
     """Calculate efficiency score based on response time"""
     if response_time >= max_time:
@@ -75,8 +157,7 @@ def calculate_efficiency_score(response_time: float, max_time: float = 30.0) ->
 def _deep_validate_data(data: Any, path: str = "root") -> Tuple[bool, str]:
     """Deep validation of data structure for serialization"""
     try:
-        serialized = json.dumps(data)
-        deserialized = json.loads(serialized)        
+        deserialized = orjson.loads(orjson.dumps(data))
         if isinstance(data, dict) and 'train_examples' in data:
             original_len = len(data['train_examples'])
             deserialized_len = len(deserialized['train_examples'])
@@ -96,13 +177,11 @@ async def _submit_task_to_miner(
     chain,
     config,
     uid: int,
-    miner: Dict,
+    miner: MinerInfo,
     problem_data: Dict
 ) -> Optional[str]:
     """Submit a task to a miner and get back a task ID"""
-    ip = miner.get("ip")
-    port = miner.get("port") or config.default_miner_port
-    url = f"http://{ip}:{port}{QUERY_ENDPOINT}"
+    url = f"{miner.base_url}{QUERY_ENDPOINT}"
     
     query_data = {
         "problem_id": problem_data['id'],
@@ -119,7 +198,7 @@ async def _submit_task_to_miner(
     
     body, headers = Epistula.create_request(
         keypair=chain.keypair,
-        receiver_hotkey=miner.get("hotkey"),
+        receiver_hotkey=miner.hotkey,
         data=query_data,
         version=1
     )
@@ -130,8 +209,8 @@ async def _submit_task_to_miner(
                 response_text = await resp.text()
                 return None
             
-            response_text = await resp.text()
-            response_json = json.loads(response_text)
+            # orjson parses the raw bytes; its JSONDecodeError subclasses json's
+            response_json = orjson.loads(await resp.read())
             task_id = response_json.get('data', {}).get('task_id')
             
             if not task_id:
@@ -150,16 +229,14 @@ async def _poll_task_result(
     chain,
     config,
     uid: int,
-    miner: Dict,
+    miner: MinerInfo,
     task_id: str,
     problem_data: Dict,
     max_attempts: int = MAX_POLL_ATTEMPTS,
     poll_interval: float = POLL_INTERVAL
 ) -> Dict:
     """Poll for task result from miner"""
-    ip = miner.get("ip")
-    port = miner.get("port") or config.default_miner_port
-    url = f"http://{ip}:{port}{CHECK_TASK_ENDPOINT}/{task_id}"
+    url = f"{miner.base_url}{CHECK_TASK_ENDPOINT}/{task_id}"
     
     t0 = datetime.now(timezone.utc).replace(tzinfo=None)
     
@@ -168,7 +245,7 @@ async def _poll_task_result(
             check_data = {"task_id": task_id}
             body, headers = Epistula.create_request(
                 keypair=chain.keypair,
-                receiver_hotkey=miner.get("hotkey"),
+                receiver_hotkey=miner.hotkey,
                 data=check_data,
                 version=1
             )
@@ -179,8 +256,7 @@ async def _poll_task_result(
                     await asyncio.sleep(poll_interval)
                     continue
                 
-                response_text = await resp.text()
-                response_json = json.loads(response_text)
+                response_json = orjson.loads(await resp.read())
                 task_data = response_json.get('data', {})
                 
                 status = task_data.get('status')
@@ -211,9 +287,9 @@ async def _poll_task_result(
                         }
                     
                     expected_output = problem_data['problem_set']['test_output']
-                    exact_match = predicted_output == expected_output
-                    partial_correctness = calculate_partial_correctness(predicted_output, expected_output)
-                    grid_similarity = calculate_grid_similarity(predicted_output, expected_output)
+                    exact_match, partial_correctness, grid_similarity = score_prediction(
+                        predicted_output, expected_output, problem_data['test_output_grid']
+                    )
                     efficiency_score = calculate_efficiency_score(dt)
                     
                     logger.info(f"UID {uid} | Problem {problem_data['id']} | Task {task_id} | "
@@ -302,7 +378,7 @@ async def _query_one_with_problem(
     chain,
     config,
     uid: int,
-    miner: Dict,
+    miner: MinerInfo,
     problem_data: Dict
 ) -> Dict:
     """Query a single miner with an ARC problem using task-based approach"""
@@ -337,16 +413,19 @@ async def query_miners_with_problems(
     chain,
     db,
     config,
-    miners: Dict[int, Dict],
+    miners: Dict[int, MinerInfo],
     problems_batch: List[Dict],
     current_block: int,
-    telemetry_client: TelemetryClient
+    telemetry_client: TelemetryClient,
+    session: Optional[aiohttp.ClientSession] = None
 ) -> Dict[int, List[Dict]]:
-    """Query all miners with multiple problems using task-based approach"""
+    """Query all miners with multiple problems using task-based approach
+
+    A shared session is left open; without one, a session is opened for this call.
+    """
     results: Dict[int, List[Dict]] = {uid: [] for uid in miners.keys()}
-    timeout = aiohttp.ClientTimeout(total=60)
     
-    async with aiohttp.ClientSession(timeout=timeout) as session:
+    async with (nullcontext(session) if session is not None else create_session()) as session:
         tasks = []
         for problem_data in problems_batch:
             for uid, miner in miners.items():
@@ -354,29 +433,34 @@ async def query_miners_with_problems(
                     session, chain, config, uid, miner, problem_data
                 ))
         
+        # Results are written in batches (and whatever is left at the end)
+        pending_rows = []
         for fut in asyncio.as_completed(tasks):
             res = await fut
             uid = res["uid"]
             results[uid].append(res)
             
-            await db.record_query_result(
-                block=current_block,
-                uid=uid,
-                success=res["success"],
-                response=res["response"],
-                error=res["error"],
-                response_time=res["rt"],
-                ts=datetime.now(timezone.utc).replace(tzinfo=None),
-                exact_match=res["metrics"]["exact_match"],
-                partial_correctness=res["metrics"]["partial_correctness"],
-                grid_similarity=res["metrics"]["grid_similarity"],
-                efficiency_score=res["metrics"]["efficiency_score"],
-                problem_id=res["problem_id"],
-                base_task_num=res.get("base_task_num"),
-                chain_length=res.get("chain_length"),
-                transformation_chain=res.get("transformation_chain"),
-                num_train_examples=res.get("num_train_examples")
-            )
+            pending_rows.append((
+                current_block,
+                uid,
+                res["success"],
+                res["response"],
+                res["error"],
+                res["rt"],
+                datetime.now(timezone.utc).replace(tzinfo=None),
+                res["metrics"]["exact_match"],
+                res["metrics"]["partial_correctness"],
+                res["metrics"]["grid_similarity"],
+                res["metrics"]["efficiency_score"],
+                res["problem_id"],
+                res.get("base_task_num"),
+                res.get("chain_length"),
+                res.get("transformation_chain"),
+                res.get("num_train_examples"),
+            ))
+            if len(pending_rows) >= RESULTS_FLUSH_ROWS:
+                await db.record_query_results(pending_rows)
+                pending_rows = []
             try:
                 if res["success"]:
                     telemetry_client.publish(
@@ -398,6 +482,8 @@ async def query_miners_with_problems(
                     )
             except Exception as e:
                 logger.warning("Couldn't send query data & results to the dashboard API - error : {e}")
+        
+        await db.record_query_results(pending_rows)
 
     
     total_queries = sum(len(r) for r in results.values())
@@ -20,32 +20,11 @@ async def calculate_scores(db, config) -> Dict[int, Dict[str, float]]:
     window_blocks = config.score_window_blocks
     min_responses = config.min_responses
 
-    rows = await db.get_recent_results(window_blocks=window_blocks, current_block=current_block)
+    # Totals are summed in Postgres: only one row per miner comes back
+    rows = await db.get_recent_stats(window_blocks=window_blocks, current_block=current_block)
     
     # agg metrics per miner
-    miner_stats: Dict[int, Dict] = {}
-    
-    for r in rows:
-        uid = int(r['uid'])
-        if uid not in miner_stats:
-            miner_stats[uid] = {
-                'count': 0,
-                'exact_matches': 0,
-                'partial_sum': 0.0,
-                'similarity_sum': 0.0,
-                'efficiency_sum': 0.0,
-                'successful_responses': 0
-            }
-        
-        stats = miner_stats[uid]
-        stats['count'] += 1
-        
-        if r['success']:
-            stats['successful_responses'] += 1
-            stats['exact_matches'] += 1 if r.get('exact_match', False) else 0
-            stats['partial_sum'] += float(r.get('partial_correctness', 0.0))
-            stats['similarity_sum'] += float(r.get('grid_similarity', 0.0))
-            stats['efficiency_sum'] += float(r.get('efficiency_score', 0.0))
+    miner_stats: Dict[int, Dict] = {int(r['uid']): dict(r) for r in rows}
     
     scores: Dict[int, Dict[str, float]] = {}
     weights = {
@@ -52,7 +52,8 @@ CREATE TABLE IF NOT EXISTS scores (
 
 -- Indices for performance
 CREATE INDEX IF NOT EXISTS idx_query_results_block ON query_results(block);
-CREATE INDEX IF NOT EXISTS idx_query_results_uid ON query_results(uid);
+-- Per-miner stats filter on uid and a block window; uid-only lookups use it too
+CREATE INDEX IF NOT EXISTS idx_query_results_uid_block ON query_results(uid, block);
 CREATE INDEX IF NOT EXISTS idx_query_results_timestamp ON query_results(timestamp);
 CREATE INDEX IF NOT EXISTS idx_query_results_base_task ON query_results(base_task_num);
 CREATE INDEX IF NOT EXISTS idx_query_results_chain_length ON query_results(chain_length);
@@ -5,6 +5,10 @@ from typing import Optional, Tuple
 import httpx
 from loguru import logger
 
+# After a send fails every retry, publishes are dropped without touching the
+# network for a backoff that doubles on each further failure, up to the max
+BACKOFF_INITIAL_S = 5.0
+BACKOFF_MAX_S = 300.0
 
 class TelemetryClient:
     def __init__(
@@ -32,6 +36,10 @@ class TelemetryClient:
         self._worker_task: Optional[asyncio.Task] = None
         self._loop = loop or asyncio.get_event_loop()
 
+        # Current backoff (0 while healthy) and the monotonic time it ends
+        self._backoff_s = 0.0
+        self._retry_at = 0.0
+
         # httpx async client, reused for connection pooling
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(
@@ -51,7 +59,7 @@ class TelemetryClient:
 
     def publish(self, route: str, payload: dict) -> None:
 
-        if not self.enabled:
+        if not self.enabled or time.monotonic() < self._retry_at:
             return
 
         try:
@@ -92,10 +100,17 @@ class TelemetryClient:
                 except asyncio.TimeoutError:
                     continue  # just loop back and check stopping flag
 
+                if time.monotonic() < self._retry_at:
+                    # queued before the endpoint went down
+                    self.queue.task_done()
+                    continue
+
                 url = f"{self.endpoint_base_url}/{route.lstrip('/')}"
                 sent = False
+                # a single probe once a backoff has run out
+                attempts = 1 if self._backoff_s else self.max_retries
 
-                for attempt in range(1, self.max_retries + 1):
+                for attempt in range(1, attempts + 1):
                     if self._stopping.is_set():
                         break
 
@@ -108,17 +123,26 @@ class TelemetryClient:
                         else:
                             logger.warning(
                                 f"Telemetry send failed {r.status_code} {r.text} "
-                                f"(attempt {attempt}/{self.max_retries})"
+                                f"(attempt {attempt}/{attempts})"
                             )
                     except Exception as e:
                         logger.warning(
                             f"Telemetry exception: {e} "
-                            f"(attempt {attempt}/{self.max_retries})"
+                            f"(attempt {attempt}/{attempts})"
                         )
                         await asyncio.sleep(0.5)
 
-                if not sent:
-                    logger.error("Dropping telemetry after max retries")
+                if sent:
+                    if self._backoff_s:
+                        logger.info("Telemetry endpoint reachable again")
+                        self._backoff_s = 0.0
+                else:
+                    self._backoff_s = min(max(2 * self._backoff_s, BACKOFF_INITIAL_S), BACKOFF_MAX_S)
+                    self._retry_at = time.monotonic() + self._backoff_s
+                    logger.error(
+                        f"Dropping telemetry after {attempts} attempts; "
+                        f"pausing publishes for {self._backoff_s:.0f}s"
+                    )
 
                 self.queue.task_done()
 
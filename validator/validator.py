@@ -7,10 +7,13 @@ import os
 from common.chain import ChainInterface
 from validator.config import ValidatorConfig
 from validator.db import Database
-from validator import cycle
+from validator import cycle, query
 from validator.synthetics.arcgen.arc_agi2_generator import ARC2Generator
 from validator.telemetry import TelemetryClient
 
+# Blocks are ~12s apart, so a head read this recent is still current
+BLOCK_CACHE_TTL_S = 2.0
+
 class Validator:
     def __init__(self, config: ValidatorConfig):
         self.config = config
@@ -53,10 +56,17 @@ class Validator:
             request_timeout_s=5.0,
         )
 
+        # Miner HTTP session shared by every query round; opened in start()
+        # because aiohttp binds it to the running loop
+        self.http = None
+
         self.last_cleanup_time = None
+        # (monotonic time read, block number) of the last successful head read
+        self._block_cache = None
     
     async def start(self):
         await self.db.connect()
+        self.http = query.create_session()
         loop = asyncio.get_event_loop()
         for sig in (signal.SIGTERM, signal.SIGINT):
             loop.add_signal_handler(
@@ -83,9 +93,15 @@ class Validator:
         logger.info("Stopping validator...")
 
     def get_current_block(self) -> int:
+        """Head block number; reads within BLOCK_CACHE_TTL_S of the last one reuse it"""
+        now = time.monotonic()
+        if self._block_cache is not None and now - self._block_cache[0] < BLOCK_CACHE_TTL_S:
+            return self._block_cache[1]
         try:
             self.chain.connect()
-            return self.chain.get_current_block()
+            block = self.chain.get_current_block()
+            self._block_cache = (now, block)
+            return block
         except Exception as e:
             logger.warning(f"Could not read current block from chain ({e}); falling back to 0")
             return 0
@@ -108,5 +124,8 @@ class Validator:
         except asyncio.CancelledError:
             logger.info("Validator run cancelled")
         finally:
+            if self.http is not None:
+                await self.http.close()
+                self.http = None
             await self.db.close()
             self.chain.substrate.close() if self.chain.substrate else None
\ No newline at end of file